@@ -0,0 +1,327 @@
+# async_connection.py
+import asyncio
+import os
+
+from sqlalchemy import select, update
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import joinedload
+from sqlalchemy.pool import StaticPool
+
+import instrumentation
+from connection import (
+    PNR_BLOCK_SIZE, Booking, SeatInventory, SeatsUnavailable, Station, Ticket, Train, User, WaitlistEntry,
+    _booking_details, _cancel_booking, _confirmed_seat_count, _dummy_password_hash, _reserve_pnr_block_on,
+    _reserve_seats, _search_result_row, _seats_left, _with_seat_inventory, booking_cache, load_engine_config,
+    station_catalog
+)
+from instrumentation import instrumented
+from passwords import hash_password, verify_password
+
+# asyncio mirrors of the search, booking and PNR status helpers in connection.py,
+# for serving many concurrent clients. They share its models, seat counter SQL,
+# station catalog and booking cache; gui.py keeps using the sync helpers.
+
+# ------------------ ENGINE ------------------
+
+# Async drivers for the sync URLs connection.py is configured with
+ASYNC_DRIVERS = {
+    'mysql': 'mysql+aiomysql',
+    'sqlite': 'sqlite+aiosqlite',
+    'postgresql': 'postgresql+asyncpg',
+}
+
+def async_url(url):
+    """The async-driver form of a database URL, e.g. mysql+mysqlconnector:// -> mysql+aiomysql://."""
+    url = make_url(url)
+    backend = url.get_backend_name()
+    if backend not in ASYNC_DRIVERS:
+        raise ValueError(f"No async driver configured for '{backend}' databases")
+    return url.set(drivername=ASYNC_DRIVERS[backend])
+
+def create_async_engine_from_config(config=None):
+    """Create an AsyncEngine from load_engine_config() settings.
+
+    FASTLINK_DB_ASYNC_URL overrides the URL; otherwise the sync URL is switched
+    to the matching async driver.
+    """
+    if config is None:
+        config = load_engine_config()
+    url = make_url(os.environ.get('FASTLINK_DB_ASYNC_URL') or async_url(config['url']))
+    options = {'echo': config['echo']}
+    if config['isolation_level']:
+        options['isolation_level'] = config['isolation_level']
+
+    if url.get_backend_name() == 'sqlite' and url.database in (None, '', ':memory:'):
+        options['poolclass'] = StaticPool
+    else:
+        options['pool_size'] = config['pool_size']
+        options['max_overflow'] = config['max_overflow']
+        options['pool_timeout'] = config['pool_timeout']
+        options['pool_recycle'] = config['pool_recycle']
+        options['pool_pre_ping'] = config['pool_pre_ping']
+
+    new_engine = create_async_engine(url, **options)
+    instrumentation.attach(new_engine)
+    return new_engine
+
+_engine = None
+
+# Objects stay readable after commit; the helpers return plain dicts anyway
+AsyncSession = async_sessionmaker(expire_on_commit=False)
+
+def get_async_engine():
+    """Return the process-wide AsyncEngine, creating it on first use."""
+    global _engine
+    if _engine is None:
+        _engine = create_async_engine_from_config()
+        AsyncSession.configure(bind=_engine)
+    return _engine
+
+def configure_async_engine(new_engine):
+    """Replace the process-wide AsyncEngine, e.g. with an aiosqlite engine in tests.
+
+    The old engine is not disposed here; await dispose_async_engine() first.
+    """
+    global _engine
+    _engine = new_engine
+    AsyncSession.configure(bind=new_engine)
+    instrumentation.attach(new_engine)
+    pnr_allocator.reset()
+    return new_engine
+
+async def dispose_async_engine():
+    """Close the pooled connections of the process-wide AsyncEngine."""
+    global _engine
+    if _engine is not None:
+        await _engine.dispose()
+        _engine = None
+
+def _session():
+    get_async_engine()
+    return AsyncSession()
+
+async def _ensure_catalog(session):
+    # Loads the shared station catalog without blocking the event loop
+    if not station_catalog.loaded:
+        result = await session.execute(
+            select(Station.station_id, Station.station_name, Station.code).order_by(Station.station_id)
+        )
+        station_catalog.load(result.all())
+
+# ------------------ PNR ------------------
+
+class AsyncPnrAllocator:
+    """PnrAllocator counterpart whose block reservations run on the async engine."""
+
+    def __init__(self, block_size=None):
+        self.block_size = block_size or PNR_BLOCK_SIZE
+        self.reset()
+
+    async def next_pnr(self):
+        async with self._lock:
+            while True:
+                if self._next >= self._end:
+                    async with get_async_engine().begin() as conn:
+                        self._next, self._end, self._taken = await conn.run_sync(
+                            _reserve_pnr_block_on, self.block_size
+                        )
+                value = self._next
+                self._next += 1
+                if value not in self._taken:
+                    return f'{value:010d}'
+
+    def reset(self):
+        """Forget the current block, e.g. after switching databases."""
+        self._lock = asyncio.Lock()
+        self._next = 0
+        self._end = 0
+        self._taken = set()
+
+pnr_allocator = AsyncPnrAllocator()
+
+# ------------------ USER AUTHENTICATION ------------------
+
+async def _authenticate(username, password, is_admin):
+    async with _session() as session:
+        user = (await session.execute(
+            select(User.user_id, User.username, User.password).filter_by(username=username, is_admin=is_admin)
+        )).first()
+
+    # The KDF runs on a worker thread so it never stalls other clients
+    if user is None:
+        await asyncio.to_thread(verify_password, password, _dummy_password_hash())
+        return None
+    matches, rehash = await asyncio.to_thread(verify_password, password, user.password)
+    if not matches:
+        return None
+    if rehash:
+        new_stored = await asyncio.to_thread(hash_password, password)
+        try:
+            async with _session() as session, session.begin():
+                await session.execute(
+                    update(User)
+                    .where(User.user_id == user.user_id, User.password == user.password)
+                    .values(password=new_stored)
+                )
+        except Exception:
+            pass  # The login itself succeeded; the upgrade is retried on the next one
+    return {
+        'user_id': user.user_id,
+        'username': user.username
+    }
+
+@instrumented
+async def login_user(username, password):
+    """Authenticate a user by username and password."""
+    return await _authenticate(username, password, is_admin=False)
+
+@instrumented
+async def login_admin(username, password):
+    """Authenticate an admin user by username and password."""
+    return await _authenticate(username, password, is_admin=True)
+
+# ------------------ TRAIN SEARCH ------------------
+
+@instrumented
+async def search_train_by_number(train_number):
+    """Search for trains by train number."""
+    async with _session() as session:
+        await _ensure_catalog(session)
+        train = (await session.execute(select(Train).filter_by(train_number=train_number))).scalars().first()
+        if not train:
+            return []
+        return [_search_result_row(train)]
+
+@instrumented
+async def search_train_by_location(source, destination, travel_date=None):
+    """Search for trains by source and destination stations; see connection.search_train_by_location."""
+    async with _session() as session:
+        await _ensure_catalog(session)
+        source_station = station_catalog.resolve(source)
+        destination_station = station_catalog.resolve(destination)
+        if not source_station or not destination_station:
+            return []
+
+        query = select(Train).where(
+            Train.source_id == source_station.station_id,
+            Train.destination_id == destination_station.station_id
+        )
+        if travel_date is None:
+            trains = (await session.execute(query)).scalars().all()
+            return [_search_result_row(train, source_station.station_name, destination_station.station_name)
+                    for train in trains]
+
+        rows = (await session.execute(_with_seat_inventory(query.where(Train.runs_on(travel_date)), travel_date))).all()
+        return [
+            _search_result_row(train, source_station.station_name, destination_station.station_name,
+                               seats_available=_seats_left(train, capacity, booked))
+            for train, capacity, booked in rows
+        ]
+
+@instrumented
+async def get_seat_availability(train_id, travel_date):
+    """Get the capacity, booked and available seat counts for a train on a date."""
+    async with _session() as session:
+        inventory = (await session.execute(
+            select(SeatInventory.capacity, SeatInventory.booked).filter_by(train_id=train_id, travel_date=travel_date)
+        )).first()
+        if inventory:
+            capacity, booked = inventory.capacity, inventory.booked
+        else:
+            capacity = await session.scalar(select(Train.capacity).filter_by(train_id=train_id))
+            if capacity is None:
+                raise ValueError("Train not found")
+            booked = await session.run_sync(_confirmed_seat_count, train_id, travel_date)
+        return {
+            'capacity': capacity,
+            'booked': booked,
+            'available': max(capacity - booked, 0)
+        }
+
+# ------------------ BOOKING ------------------
+
+@instrumented
+async def book_ticket(user_id, train_id, travel_date, booking_date, passenger_list, allow_waitlist=False):
+    """Book tickets for multiple passengers; see connection.book_ticket."""
+    if not passenger_list:
+        raise ValueError("No passenger information provided")
+
+    pnr = await pnr_allocator.next_pnr()
+
+    async with _session() as session:
+        async with session.begin():
+            # The same conditional seat UPDATE as the sync helper, run through the greenlet bridge
+            status = 'Confirmed'
+            try:
+                await session.run_sync(_reserve_seats, train_id, travel_date, len(passenger_list))
+            except SeatsUnavailable:
+                if not allow_waitlist:
+                    raise
+                status = 'Waitlisted'
+
+            new_booking = Booking(
+                user_id=user_id,
+                train_id=train_id,
+                pnr_number=pnr,
+                booking_date=booking_date,
+                travel_date=travel_date,
+                status=status
+            )
+            session.add(new_booking)
+            await session.flush()  # To get the booking_id
+
+            if status == 'Waitlisted':
+                session.add(WaitlistEntry(
+                    booking_id=new_booking.booking_id,
+                    train_id=train_id,
+                    travel_date=travel_date,
+                    seats=len(passenger_list)
+                ))
+
+            session.add_all([
+                Ticket(
+                    booking_id=new_booking.booking_id,
+                    passenger_name=passenger['name'],
+                    age=passenger['age'],
+                    gender=passenger['gender']
+                )
+                for passenger in passenger_list
+            ])
+        booking_cache.invalidate(pnr)
+        return new_booking.booking_id, pnr, status
+
+@instrumented
+async def cancel_ticket(pnr, reason, cancel_date):
+    """Cancel a booking by PNR number; freed seats go to the waitlist as in connection.cancel_ticket."""
+    async with _session() as session:
+        async with session.begin():
+            promoted = await session.run_sync(_cancel_booking, pnr, reason, cancel_date)
+        if promoted is None:
+            return False
+        for changed_pnr in [pnr, *promoted]:
+            booking_cache.invalidate(changed_pnr)
+        return True
+
+# ------------------ STATUS ------------------
+
+@instrumented
+async def get_booking_by_pnr(pnr):
+    """Get booking details by PNR number."""
+    cached = booking_cache.get(pnr)
+    if cached is not None:
+        return cached
+
+    async with _session() as session:
+        result = await session.execute(
+            select(Booking)
+            .options(joinedload(Booking.train), joinedload(Booking.tickets))
+            .filter_by(pnr_number=pnr)
+        )
+        booking = result.unique().scalars().one_or_none()
+        if not booking:
+            return None
+
+        booking_details = _booking_details(booking)
+        booking_cache.put(pnr, booking_details)
+        return booking_details
@@ -0,0 +1,89 @@
+# background.py
+import queue
+from concurrent.futures import ThreadPoolExecutor
+
+class BackgroundRunner:
+    """Run blocking calls on a thread pool and deliver results on the Tk thread.
+    
+    Tkinter is not thread-safe, so worker threads only put finished futures on a
+    queue; the Tk event loop drains it with root.after() and runs the callbacks.
+    Calls submitted under the same key supersede each other: only the newest
+    one's result is delivered, and older ones are cancelled if not yet started.
+    """
+    
+    def __init__(self, root, max_workers=4, poll_interval=50, on_busy_change=None):
+        self.root = root
+        self.poll_interval = poll_interval
+        self.on_busy_change = on_busy_change
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="fastlink-db")
+        self._results = queue.Queue()
+        self._latest = {}
+        self._pending = 0
+        self._polling = False
+    
+    @property
+    def busy(self):
+        return self._pending > 0
+    
+    def submit(self, func, *args, on_success=None, on_error=None, key=None, **kwargs):
+        """Run func(*args, **kwargs) in the background; callbacks run on the Tk thread."""
+        if key is not None:
+            self.cancel(key)
+        
+        future = self._executor.submit(func, *args, **kwargs)
+        if key is not None:
+            self._latest[key] = future
+        
+        self._pending += 1
+        if self._pending == 1:
+            self._notify_busy()
+        future.add_done_callback(lambda done: self._results.put((done, key, on_success, on_error)))
+        
+        if not self._polling:
+            self._polling = True
+            self.root.after(self.poll_interval, self._poll)
+        return future
+    
+    def cancel(self, key):
+        """Drop the result of the call running under key, cancelling it if it has not started."""
+        future = self._latest.pop(key, None)
+        if future is not None:
+            future.cancel()
+    
+    def shutdown(self):
+        self._executor.shutdown(wait=False, cancel_futures=True)
+    
+    def _poll(self):
+        while True:
+            try:
+                future, key, on_success, on_error = self._results.get_nowait()
+            except queue.Empty:
+                break
+            
+            self._pending -= 1
+            if key is not None:
+                if self._latest.get(key) is not future:
+                    continue  # Superseded by a newer call under the same key
+                del self._latest[key]
+            if future.cancelled():
+                continue
+            
+            error = future.exception()
+            try:
+                if error is not None:
+                    if on_error:
+                        on_error(error)
+                elif on_success:
+                    on_success(future.result())
+            except Exception as e:
+                self.root.report_callback_exception(type(e), e, e.__traceback__)
+        
+        if self._pending > 0:
+            self.root.after(self.poll_interval, self._poll)
+        else:
+            self._polling = False
+            self._notify_busy()
+    
+    def _notify_busy(self):
+        if self.on_busy_change:
+            self.on_busy_change(self.busy)
@@ -0,0 +1,177 @@
+# benchmarks/bench_async.py
+"""Compare sync and asyncio throughput for a search/status/booking mix under many clients.
+
+The database stand-in is a SQLite file whose cursors sleep for --latency-ms
+before every statement, like a network round trip to a MySQL server. The
+sync helpers run on a thread pool (one thread per client, as a threaded
+server would), the async helpers as one asyncio task per client; both get
+the same connection pool size.
+
+    python benchmarks/bench_async.py --clients 200 --ops 4000 --latency-ms 2
+"""
+import argparse
+import asyncio
+import os
+import random
+import sqlite3
+import statistics
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, time as dtime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import create_engine, insert
+from sqlalchemy.ext.asyncio import create_async_engine
+
+import async_connection
+import connection
+from connection import Station, Train, User
+
+TRAVEL_DATE = date(2030, 1, 7)
+N_STATIONS = 200
+N_TRAINS = 5000
+LATENCY = 0.002
+
+
+class LatencyCursor(sqlite3.Cursor):
+    def execute(self, *args):
+        time.sleep(LATENCY)
+        return super().execute(*args)
+
+    def executemany(self, *args):
+        time.sleep(LATENCY)
+        return super().executemany(*args)
+
+
+class LatencyConnection(sqlite3.Connection):
+    def cursor(self, factory=LatencyCursor):
+        return super().cursor(factory)
+
+
+def seed(path):
+    engine = create_engine(f"sqlite:///{path}")
+    with engine.connect() as conn:
+        conn.exec_driver_sql("PRAGMA journal_mode=WAL")
+    connection.bootstrap_schema(engine)
+    rng = random.Random(5)
+    with engine.begin() as conn:
+        conn.execute(insert(Station), [{"station_id": i, "station_name": f"Station {i}", "code": f"S{i}"}
+                                       for i in range(1, N_STATIONS + 1)])
+        conn.execute(insert(Train), [
+            {"train_id": i, "train_number": f"T{i}", "train_name": f"Express {i}",
+             "source_id": rng.randint(1, 20), "destination_id": rng.randint(1, 20),
+             "departure_time": dtime(i % 24, 0), "arrival_time": dtime((i + 5) % 24, 0),
+             "travel_days": "Daily", "capacity": 1000000}
+            for i in range(1, N_TRAINS + 1)
+        ])
+        conn.execute(insert(User), [{"user_id": 1, "username": "agent", "password": "x", "is_admin": False}])
+    engine.dispose()
+
+
+def workload(n_ops, book_share, seed_value):
+    """A fixed list of (operation, args): book_share bookings, the rest 2:1 route searches and PNR status."""
+    rng = random.Random(seed_value)
+    ops = []
+    for _ in range(n_ops):
+        roll = rng.random()
+        if roll < (1 - book_share) * 2 / 3:
+            ops.append(("search", (f"Station {rng.randint(1, 20)}", f"S{rng.randint(1, 20)}", TRAVEL_DATE)))
+        elif roll < 1 - book_share:
+            ops.append(("status", (None,)))
+        else:
+            ops.append(("book", (1, rng.randint(1, N_TRAINS), TRAVEL_DATE, date.today(),
+                                 [{"name": "Passenger", "age": 30, "gender": "F"}])))
+    return ops
+
+
+def summary(label, latencies, elapsed):
+    latencies.sort()
+    p99 = latencies[int(len(latencies) * 0.99) - 1]
+    print(f"{label:<28}{len(latencies) / elapsed:10.0f} ops/s   p50 {statistics.median(latencies) * 1000:7.1f} ms"
+          f"   p99 {p99 * 1000:7.1f} ms")
+
+
+def run_sync(path, ops, threads, pool_size, pnrs):
+    engine = create_engine(f"sqlite:///{path}", pool_size=pool_size, max_overflow=0, pool_timeout=300,
+                           connect_args={"factory": LatencyConnection, "timeout": 60, "check_same_thread": False})
+    connection.configure_engine(engine)
+    helpers = {
+        "search": connection.search_train_by_location,
+        "status": lambda _: connection.get_booking_by_pnr(random.choice(pnrs)),
+        "book": connection.book_ticket,
+    }
+
+    def one(op):
+        start = time.perf_counter()
+        helpers[op[0]](*op[1])
+        return time.perf_counter() - start
+
+    connection.station_catalog.all()
+    start = time.perf_counter()
+    with ThreadPoolExecutor(threads) as pool:
+        latencies = list(pool.map(one, ops))
+    elapsed = time.perf_counter() - start
+    engine.dispose()
+    return latencies, elapsed
+
+
+async def run_async(path, ops, clients, pool_size, pnrs):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{path}", pool_size=pool_size, max_overflow=0,
+                                 pool_timeout=300, connect_args={"factory": LatencyConnection, "timeout": 60})
+    async_connection.configure_async_engine(engine)
+    helpers = {
+        "search": async_connection.search_train_by_location,
+        "status": lambda _: async_connection.get_booking_by_pnr(random.choice(pnrs)),
+        "book": async_connection.book_ticket,
+    }
+    queue = list(reversed(ops))
+    latencies = []
+
+    async def client():
+        while queue:
+            op = queue.pop()
+            start = time.perf_counter()
+            await helpers[op[0]](*op[1])
+            latencies.append(time.perf_counter() - start)
+
+    await async_connection.search_train_by_location("Station 1", "Station 2")
+    start = time.perf_counter()
+    await asyncio.gather(*(client() for _ in range(clients)))
+    elapsed = time.perf_counter() - start
+    await engine.dispose()
+    return latencies, elapsed
+
+
+def main():
+    global LATENCY
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--clients", type=int, default=200, help="concurrent clients (threads or tasks)")
+    parser.add_argument("--ops", type=int, default=4000, help="operations per run")
+    parser.add_argument("--pool-size", type=int, default=20, help="database connections for either API")
+    parser.add_argument("--book-share", type=float, default=0.05, help="fraction of operations that book")
+    parser.add_argument("--latency-ms", type=float, default=2.0, help="simulated round trip per statement")
+    args = parser.parse_args()
+    LATENCY = args.latency_ms / 1000
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "bench.db")
+        seed(path)
+        engine = create_engine(f"sqlite:///{path}")
+        connection.configure_engine(engine)
+        pnrs = [connection.book_ticket(1, i, TRAVEL_DATE, date.today(),
+                                       [{"name": "Passenger", "age": 30, "gender": "F"}])[1] for i in range(1, 201)]
+        engine.dispose()
+
+        ops = workload(args.ops, args.book_share, 1)
+        print(f"{args.ops} operations, {args.clients} clients, pool of {args.pool_size}, "
+              f"{args.latency_ms:g} ms per statement\n")
+        summary(f"sync, {args.pool_size} threads", *run_sync(path, ops, args.pool_size, args.pool_size, pnrs))
+        summary(f"sync, {args.clients} threads", *run_sync(path, ops, args.clients, args.pool_size, pnrs))
+        summary(f"async, {args.clients} tasks", *asyncio.run(run_async(path, ops, args.clients, args.pool_size, pnrs)))
+
+
+if __name__ == "__main__":
+    main()
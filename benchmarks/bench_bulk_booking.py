@@ -0,0 +1,96 @@
+# benchmarks/bench_bulk_booking.py
+"""Compare book_tickets_bulk() with a loop of book_ticket() calls.
+
+Both runs book the same agent-style batch (1-4 passengers per request, spread
+over a handful of trains and dates) into a throwaway SQLite file unless
+FASTLINK_DB_URL points elsewhere.
+
+    python benchmarks/bench_bulk_booking.py --requests 2000
+"""
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+_tmp_dir = tempfile.mkdtemp()
+os.environ.setdefault("FASTLINK_DB_URL", f"sqlite:///{os.path.join(_tmp_dir, 'bulk.db')}")
+
+import connection
+from connection import Session, Station, Train, User
+
+
+def setup(n_trains):
+    connection.bootstrap_schema()
+    session = Session()
+    try:
+        session.add_all([
+            Station(station_name="Bulk Source", code="BLKS"),
+            Station(station_name="Bulk Destination", code="BLKD"),
+            User(username="bulk_agent", password="x", is_admin=False),
+        ])
+        session.flush()
+        session.add_all([
+            Train(train_number=f"BULK{i}", train_name=f"Agent Express {i}", source_id=1, destination_id=2,
+                  departure_time=connection.time(6, 0), arrival_time=connection.time(12, 0),
+                  travel_days="Daily", capacity=100000)
+            for i in range(n_trains)
+        ])
+        session.commit()
+        train_ids = [train_id for (train_id,) in session.query(Train.train_id).filter(Train.train_number.like("BULK%"))]
+        user_id = session.query(User.user_id).filter_by(username="bulk_agent").scalar()
+        return train_ids, user_id
+    finally:
+        session.close()
+
+
+def make_requests(n, train_ids, user_id, first_date, seed):
+    rng = random.Random(seed)
+    return [
+        {
+            "user_id": user_id,
+            "train_id": rng.choice(train_ids),
+            "travel_date": first_date + timedelta(days=rng.randint(0, 6)),
+            "booking_date": date.today(),
+            "passenger_list": [{"name": f"Passenger {i}", "age": 30, "gender": "M"}
+                               for _ in range(rng.randint(1, 4))],
+        }
+        for i in range(n)
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--trains", type=int, default=5)
+    args = parser.parse_args()
+
+    train_ids, user_id = setup(args.trains)
+
+    looped = make_requests(args.requests, train_ids, user_id, date.today() + timedelta(days=30), seed=1)
+    start = time.perf_counter()
+    for request in looped:
+        connection.book_ticket(request["user_id"], request["train_id"], request["travel_date"],
+                               request["booking_date"], request["passenger_list"])
+    loop_elapsed = time.perf_counter() - start
+
+    bulk = make_requests(args.requests, train_ids, user_id, date.today() + timedelta(days=60), seed=2)
+    start = time.perf_counter()
+    results = connection.book_tickets_bulk(bulk)
+    bulk_elapsed = time.perf_counter() - start
+    failures = [r for r in results if not r["success"]]
+
+    print(f"requests:              {args.requests}")
+    print(f"book_ticket loop:      {loop_elapsed:.2f} s ({args.requests / loop_elapsed:,.0f} bookings/s)")
+    print(f"book_tickets_bulk:     {bulk_elapsed:.2f} s ({args.requests / bulk_elapsed:,.0f} bookings/s)")
+    print(f"speedup:               {loop_elapsed / bulk_elapsed:.1f}x")
+    print(f"bulk failures:         {len(failures)}")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
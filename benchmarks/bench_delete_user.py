@@ -0,0 +1,85 @@
+# benchmarks/bench_delete_user.py
+"""Time delete_user_from_db and count its statements as a user's booking count grows.
+
+Each run seeds a fresh SQLite file with one user holding --bookings bookings
+(two tickets each, every tenth cancelled), deletes the user with and without
+archiving, and reports wall time and SQL statements issued.
+
+    python benchmarks/bench_delete_user.py --bookings 100 1000 10000
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+from datetime import date, time as dtime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import create_engine, insert
+
+import connection
+import instrumentation
+from connection import Booking, Cancellation, SeatInventory, Station, Ticket, Train, User
+
+TRAVEL_DATE = date(2030, 1, 7)
+
+
+def seed(engine, n_bookings):
+    connection.bootstrap_schema(engine)
+    with engine.begin() as conn:
+        conn.execute(insert(Station), [{"station_id": i, "station_name": f"Station {i}", "code": f"S{i}"}
+                                       for i in (1, 2)])
+        conn.execute(insert(Train), [
+            {"train_id": i, "train_number": f"T{i}", "train_name": f"Express {i}", "source_id": 1,
+             "destination_id": 2, "departure_time": dtime(6, 0), "arrival_time": dtime(9, 0),
+             "travel_days": "Daily", "capacity": 1000000}
+            for i in range(1, 11)
+        ])
+        conn.execute(insert(User), [{"user_id": 1, "username": "agent", "password": "x", "is_admin": False}])
+        bookings = [
+            {"booking_id": i, "user_id": 1, "train_id": i % 10 + 1, "pnr_number": f"{i:010d}",
+             "booking_date": date.today(), "travel_date": TRAVEL_DATE,
+             "status": "Cancelled" if i % 10 == 0 else "Confirmed"}
+            for i in range(1, n_bookings + 1)
+        ]
+        conn.execute(insert(Booking), bookings)
+        conn.execute(insert(Ticket), [{"booking_id": b["booking_id"], "passenger_name": "P", "age": 30, "gender": g}
+                                      for b in bookings for g in ("F", "M")])
+        conn.execute(insert(Cancellation), [{"booking_id": b["booking_id"], "cancelled_on": date.today(),
+                                             "reason": "Plans changed"}
+                                            for b in bookings if b["status"] == "Cancelled"])
+        held = {}
+        for b in bookings:
+            if b["status"] == "Confirmed":
+                held[b["train_id"]] = held.get(b["train_id"], 0) + 2
+        conn.execute(insert(SeatInventory), [{"train_id": train_id, "travel_date": TRAVEL_DATE,
+                                              "capacity": 1000000, "booked": booked}
+                                             for train_id, booked in held.items()])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--bookings", type=int, nargs="+", default=[100, 1000, 10000])
+    args = parser.parse_args()
+
+    print(f"{'bookings':>10}{'archive':>9}{'time (ms)':>12}{'statements':>12}")
+    for n_bookings in args.bookings:
+        for archive in (False, True):
+            with tempfile.TemporaryDirectory() as tmp:
+                engine = create_engine(f"sqlite:///{os.path.join(tmp, 'bench.db')}")
+                seed(engine, n_bookings)
+                connection.configure_engine(engine)
+                instrumentation.reset()
+                instrumentation.enable()
+                start = time.perf_counter()
+                connection.delete_user_from_db("agent", archive=archive)
+                elapsed = time.perf_counter() - start
+                instrumentation.disable()
+                statements = instrumentation.snapshot()["helpers"]["delete_user_from_db"]["statements"]
+                print(f"{n_bookings:>10}{str(archive):>9}{elapsed * 1000:12.1f}{statements:>12}")
+                engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+# benchmarks/bench_export.py
+"""Time a manifest export and check that its memory use does not grow with the row count.
+
+Seeds a SQLite file with synthetic trains, bookings and tickets, then exports
+every ticket to CSV (and Parquet, when pyarrow is installed) while tracing the
+peak Python memory.
+
+    python benchmarks/bench_export.py --tickets 1000000
+"""
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import date, time as dtime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import create_engine, insert
+
+import connection
+import export
+from connection import Booking, Station, Ticket, Train, User
+
+CHUNK = 50000
+START_DATE = date(2025, 1, 1)
+
+
+def seed(engine, n_trains, n_tickets):
+    rng = random.Random(11)
+    with engine.begin() as conn:
+        conn.execute(insert(Station), [
+            {"station_id": i, "station_name": f"Station {i}", "code": f"S{i}"} for i in range(1, 101)
+        ])
+        conn.execute(insert(Train), [
+            {"train_id": i, "train_number": f"T{i}", "train_name": f"Express {i}",
+             "source_id": rng.randint(1, 100), "destination_id": rng.randint(1, 100),
+             "departure_time": dtime(i % 24, 0), "arrival_time": dtime((i + 5) % 24, 0), "travel_days": "Daily"}
+            for i in range(1, n_trains + 1)
+        ])
+        conn.execute(insert(User), [{"user_id": 1, "username": "agent", "password": "x", "is_admin": False}])
+
+    # Three passengers per booking
+    for start in range(1, n_tickets + 1, CHUNK):
+        ids = range(start, min(start + CHUNK, n_tickets + 1))
+        with engine.begin() as conn:
+            conn.execute(insert(Booking), [
+                {"booking_id": i, "user_id": 1, "train_id": rng.randint(1, n_trains), "pnr_number": f"{i:010d}",
+                 "booking_date": START_DATE, "travel_date": START_DATE + timedelta(days=rng.randint(0, 89)),
+                 "status": "Cancelled" if rng.random() < 0.1 else "Confirmed"}
+                for i in ids if i % 3 == 1
+            ])
+            conn.execute(insert(Ticket), [
+                {"ticket_id": i, "booking_id": i - (i - 1) % 3, "passenger_name": f"Passenger {i}",
+                 "age": 30, "gender": "F"}
+                for i in ids
+            ])
+
+
+def run(label, path, **filters):
+    start = time.perf_counter()
+    count = export.export_manifest(path, **filters)
+    elapsed = time.perf_counter() - start
+    # Trace a second pass separately; tracemalloc slows the export down several times
+    tracemalloc.start()
+    export.export_manifest(path, **filters)
+    peak = tracemalloc.get_traced_memory()[1] / 2 ** 20
+    tracemalloc.stop()
+    print(f"{label:<24}{count:>10} rows{elapsed:>8.1f} s{count / max(elapsed, 1e-9):>10.0f} rows/s  peak {peak:6.1f} MiB")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--trains", type=int, default=500)
+    parser.add_argument("--tickets", type=int, default=1000000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_engine(f"sqlite:///{os.path.join(tmp, 'bench.db')}")
+        connection.bootstrap_schema(engine)
+        connection.configure_engine(engine)
+
+        start = time.perf_counter()
+        seed(engine, args.trains, args.tickets)
+        print(f"seeded {args.tickets} tickets in {time.perf_counter() - start:.1f} s\n")
+
+        run("one train, one week", os.path.join(tmp, "train.csv"), train_id=1,
+            start_date=START_DATE, end_date=START_DATE + timedelta(days=6))
+        run("confirmed, one month", os.path.join(tmp, "month.csv"), status="Confirmed",
+            start_date=START_DATE, end_date=START_DATE + timedelta(days=29))
+        run("everything, CSV", os.path.join(tmp, "all.csv"))
+        if export.pyarrow is not None:
+            run("everything, Parquet", os.path.join(tmp, "all.parquet"))
+        else:
+            print("pyarrow is not installed; skipping the Parquet export")
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
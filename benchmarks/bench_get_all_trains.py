@@ -0,0 +1,79 @@
+# benchmarks/bench_get_all_trains.py
+"""Count the SQL statements and time spent per get_all_trains() call.
+
+Seeds an in-memory SQLite database with synthetic stations and trains, so the
+configured MySQL data is never touched.
+
+    python benchmarks/bench_get_all_trains.py --trains 5000 --repeat 5
+"""
+import argparse
+import os
+import sys
+import time
+from datetime import time as dtime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ["FASTLINK_DB_URL"] = "sqlite://"
+
+from sqlalchemy import event
+
+import connection
+from connection import Session, Station, Train
+
+
+def seed(n_stations, n_trains):
+    session = Session()
+    try:
+        session.add_all([
+            Station(station_id=i, station_name=f"Station {i}", code=f"S{i}")
+            for i in range(1, n_stations + 1)
+        ])
+        session.add_all([
+            Train(
+                train_id=i,
+                train_number=f"T{i}",
+                train_name=f"Express {i}",
+                source_id=(i % n_stations) + 1,
+                destination_id=((i + 7) % n_stations) + 1,
+                departure_time=dtime(i % 24, i % 60),
+                arrival_time=dtime((i + 5) % 24, (i * 7) % 60),
+                travel_days="Daily",
+            )
+            for i in range(1, n_trains + 1)
+        ])
+        session.commit()
+    finally:
+        session.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--stations", type=int, default=200)
+    parser.add_argument("--trains", type=int, default=5000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    connection.bootstrap_schema()
+    seed(args.stations, args.trains)
+
+    statements = []
+
+    @event.listens_for(connection.engine, "before_cursor_execute")
+    def count_statement(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    timings = []
+    for _ in range(args.repeat):
+        statements.clear()
+        start = time.perf_counter()
+        rows = connection.get_all_trains()
+        timings.append(time.perf_counter() - start)
+
+    print(f"trains:              {len(rows)}")
+    print(f"statements per call: {len(statements)}")
+    print(f"best time per call:  {min(timings) * 1000:.1f} ms")
+    print(f"mean time per call:  {sum(timings) / len(timings) * 1000:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+# benchmarks/bench_import.py
+"""Compare a bulk timetable import with adding trains one at a time.
+
+Writes a synthetic stations CSV and trains CSV, imports them into a fresh
+SQLite file with importer.py, then times add_train() for a sample of trains
+and extrapolates it to the same number of rows.
+
+    python benchmarks/bench_import.py --trains 50000
+"""
+import argparse
+import csv
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import create_engine
+
+import connection
+import importer
+
+PATTERNS = ["Daily", "Mon-Fri", "Mon, Wed, Fri", "Sat-Sun", "Tue, Thu, Sat", ""]
+
+
+def write_files(tmp, n_stations, n_trains, rng):
+    stations_path = os.path.join(tmp, "stations.csv")
+    with open(stations_path, "w", newline="") as handle:
+        writer = csv.writer(handle)
+        writer.writerow(["station_name", "code"])
+        writer.writerows([f"Station {i}", f"S{i}"] for i in range(1, n_stations + 1))
+
+    trains_path = os.path.join(tmp, "trains.csv")
+    with open(trains_path, "w", newline="") as handle:
+        writer = csv.writer(handle)
+        writer.writerow(["train_number", "train_name", "source", "destination", "departure_time",
+                         "arrival_time", "travel_days", "capacity"])
+        for i in range(1, n_trains + 1):
+            writer.writerow([f"T{i}", f"Express {i}", f"S{rng.randint(1, n_stations)}",
+                             f"S{rng.randint(1, n_stations)}", f"{rng.randint(0, 23):02d}:{rng.randint(0, 59):02d}",
+                             f"{rng.randint(0, 23):02d}:{rng.randint(0, 59):02d}", rng.choice(PATTERNS),
+                             rng.choice(["", "72", "500"])])
+    return stations_path, trains_path
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--stations", type=int, default=5000)
+    parser.add_argument("--trains", type=int, default=50000)
+    parser.add_argument("--sample", type=int, default=500, help="trains added one at a time for comparison")
+    args = parser.parse_args()
+
+    rng = random.Random(17)
+    with tempfile.TemporaryDirectory() as tmp:
+        stations_path, trains_path = write_files(tmp, args.stations, args.trains, rng)
+        engine = create_engine(f"sqlite:///{os.path.join(tmp, 'bench.db')}")
+        connection.bootstrap_schema(engine)
+        connection.configure_engine(engine)
+
+        start = time.perf_counter()
+        result = importer.import_stations(importer.read_rows(stations_path))
+        label = f"import {result['inserted']} stations:"
+        print(f"{label:<30}{time.perf_counter() - start:8.2f} s")
+
+        start = time.perf_counter()
+        result = importer.import_trains(importer.read_rows(trains_path))
+        bulk = time.perf_counter() - start
+        label = f"import {result['inserted']} trains:"
+        print(f"{label:<30}{bulk:8.2f} s  ({len(result['errors'])} rejected)")
+
+        start = time.perf_counter()
+        result = importer.import_trains(importer.read_rows(trains_path))
+        print(f"{'re-import as updates:':<30}{time.perf_counter() - start:8.2f} s  ({result['updated']} updated)")
+
+        start = time.perf_counter()
+        for i in range(args.sample):
+            connection.add_train(f"X{i}", f"Single {i}", rng.randint(1, args.stations), rng.randint(1, args.stations),
+                                 "06:00", "12:00", "Daily")
+        single = (time.perf_counter() - start) / args.sample
+        print(f"{'add_train(), per train:':<30}{single * 1000:8.2f} ms  "
+              f"(~{single * args.trains:.0f} s for {args.trains}, {single * args.trains / bulk:.0f}x slower)")
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+# benchmarks/bench_indexes.py
+"""Time the route search and booking lookup queries with and without indexes.
+
+Seeds a SQLite file with synthetic stations, trains, users, bookings and one
+ticket per booking, runs each lookup pattern against a random sample of keys
+with the model indexes dropped, then again after bootstrap_schema() recreates
+them.
+
+    python benchmarks/bench_indexes.py --bookings 1000000
+"""
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+from datetime import date, time as dtime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import create_engine, func, insert, select
+
+import connection
+from connection import Base, Booking, Station, Ticket, Train, User
+
+CHUNK = 50000
+START_DATE = date(2025, 1, 1)
+
+
+def seed(engine, n_stations, n_trains, n_users, n_bookings):
+    rng = random.Random(42)
+    with engine.begin() as conn:
+        conn.execute(insert(Station), [
+            {"station_id": i, "station_name": f"Station {i}", "code": f"S{i}"}
+            for i in range(1, n_stations + 1)
+        ])
+        conn.execute(insert(Train), [
+            {"train_id": i, "train_number": f"T{i}", "train_name": f"Express {i}",
+             "source_id": rng.randint(1, n_stations), "destination_id": rng.randint(1, n_stations),
+             "departure_time": dtime(i % 24, i % 60), "arrival_time": dtime((i + 5) % 24, i % 60),
+             "travel_days": "Daily"}
+            for i in range(1, n_trains + 1)
+        ])
+        conn.execute(insert(User), [
+            {"user_id": i, "username": f"user{i}", "password": "x", "is_admin": False}
+            for i in range(1, n_users + 1)
+        ])
+
+    for start in range(1, n_bookings + 1, CHUNK):
+        ids = range(start, min(start + CHUNK, n_bookings + 1))
+        with engine.begin() as conn:
+            conn.execute(insert(Booking), [
+                {"booking_id": i, "user_id": rng.randint(1, n_users), "train_id": rng.randint(1, n_trains),
+                 "pnr_number": f"{i:010d}", "booking_date": START_DATE,
+                 "travel_date": START_DATE + timedelta(days=rng.randint(0, 364)),
+                 "status": "Cancelled" if rng.random() < 0.1 else "Confirmed"}
+                for i in ids
+            ])
+            conn.execute(insert(Ticket), [
+                {"ticket_id": i, "booking_id": i, "passenger_name": f"Passenger {i}", "age": 30, "gender": "F"}
+                for i in ids
+            ])
+
+
+def lookups(n_stations, n_trains, n_users, n_bookings):
+    return {
+        "trains by (source, destination)": lambda rng: select(Train.train_id).where(
+            Train.source_id == rng.randint(1, n_stations), Train.destination_id == rng.randint(1, n_stations)),
+        "trains by route and weekday": lambda rng: select(Train.train_id).where(
+            Train.source_id == rng.randint(1, n_stations), Train.destination_id == rng.randint(1, n_stations),
+            Train.runs_on(START_DATE + timedelta(days=rng.randint(0, 6)))),
+        "station by lower(name)": lambda rng: select(Station.station_id).where(
+            func.lower(Station.station_name) == f"station {rng.randint(1, n_stations)}"),
+        "bookings by user_id": lambda rng: select(Booking.booking_id).where(
+            Booking.user_id == rng.randint(1, n_users)),
+        "confirmed count by train": lambda rng: select(func.count()).select_from(Booking).where(
+            Booking.train_id == rng.randint(1, n_trains), Booking.status == "Confirmed"),
+        "bookings by travel_date": lambda rng: select(func.count()).select_from(Booking).where(
+            Booking.travel_date == START_DATE + timedelta(days=rng.randint(0, 364))),
+        "tickets by booking_id": lambda rng: select(Ticket.ticket_id).where(
+            Ticket.booking_id == rng.randint(1, n_bookings)),
+    }
+
+
+def run_lookups(engine, queries, samples):
+    results = {}
+    with engine.connect() as conn:
+        for label, build in queries.items():
+            rng = random.Random(7)
+            statements = [build(rng) for _ in range(samples)]
+            start = time.perf_counter()
+            for statement in statements:
+                conn.execute(statement).all()
+            results[label] = (time.perf_counter() - start) / samples
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--stations", type=int, default=2000)
+    parser.add_argument("--trains", type=int, default=20000)
+    parser.add_argument("--users", type=int, default=50000)
+    parser.add_argument("--bookings", type=int, default=1000000)
+    parser.add_argument("--samples", type=int, default=20)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_engine(f"sqlite:///{os.path.join(tmp, 'bench.db')}")
+        Base.metadata.create_all(engine)
+
+        start = time.perf_counter()
+        seed(engine, args.stations, args.trains, args.users, args.bookings)
+        print(f"seeded {args.bookings} bookings in {time.perf_counter() - start:.1f} s")
+
+        queries = lookups(args.stations, args.trains, args.users, args.bookings)
+
+        for table in Base.metadata.sorted_tables:
+            for index in table.indexes:
+                index.drop(engine)
+        without = run_lookups(engine, queries, args.samples)
+
+        start = time.perf_counter()
+        connection.bootstrap_schema(engine)
+        print(f"built indexes in {time.perf_counter() - start:.1f} s")
+        with_indexes = run_lookups(engine, queries, args.samples)
+
+        print(f"\n{'lookup':<34}{'no index':>12}{'indexed':>12}{'speedup':>10}")
+        for label in queries:
+            before, after = without[label] * 1000, with_indexes[label] * 1000
+            print(f"{label:<34}{before:>9.3f} ms{after:>9.3f} ms{before / after:>9.0f}x")
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
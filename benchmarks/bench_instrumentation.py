@@ -0,0 +1,86 @@
+# benchmarks/bench_instrumentation.py
+"""Measure what instrumentation costs per helper call, disabled and enabled.
+
+Seeds a SQLite file with stations, trains and bookings, then times a route
+search, a PNR lookup and a booking with instrumentation off and on.
+
+    python benchmarks/bench_instrumentation.py --calls 2000
+"""
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+from datetime import date, time as dtime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import create_engine, insert
+
+import connection
+import instrumentation
+from connection import Station, Train, User
+
+TRAVEL_DATE = date(2030, 1, 7)
+
+
+def seed(engine):
+    with engine.begin() as conn:
+        conn.execute(insert(Station), [{"station_id": i, "station_name": f"Station {i}", "code": f"S{i}"}
+                                       for i in range(1, 101)])
+        conn.execute(insert(Train), [
+            {"train_id": i, "train_number": f"T{i}", "train_name": f"Express {i}", "source_id": i % 100 + 1,
+             "destination_id": (i * 7) % 100 + 1, "departure_time": dtime(i % 24, 0),
+             "arrival_time": dtime((i + 5) % 24, 0), "travel_days": "Daily", "capacity": 1000000}
+            for i in range(1, 2001)
+        ])
+        conn.execute(insert(User), [{"user_id": 1, "username": "agent", "password": "x", "is_admin": False}])
+
+
+def time_calls(func, calls):
+    samples = []
+    for _ in range(calls):
+        start = time.perf_counter()
+        func()
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples) * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--calls", type=int, default=2000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_engine(f"sqlite:///{os.path.join(tmp, 'bench.db')}")
+        connection.bootstrap_schema(engine)
+        connection.configure_engine(engine)
+        seed(engine)
+        _, pnr, _ = connection.book_ticket(1, 1, TRAVEL_DATE, date.today(), [{"name": "A", "age": 30, "gender": "F"}])
+        passenger = [{"name": "B", "age": 30, "gender": "M"}]
+
+        cases = [
+            ("search_train_by_location", lambda: connection.search_train_by_location("Station 2", "Station 8")),
+            ("get_booking_by_pnr", lambda: connection.get_booking_by_pnr(pnr)),
+            ("book_ticket", lambda: connection.book_ticket(1, 1, TRAVEL_DATE, date.today(), passenger)),
+        ]
+        print(f"{'helper':<30}{'off (us)':>10}{'on (us)':>10}{'overhead':>10}")
+        for label, func in cases:
+            func()
+            instrumentation.disable()
+            off = time_calls(func, args.calls)
+            instrumentation.enable()
+            on = time_calls(func, args.calls)
+            instrumentation.disable()
+            print(f"{label:<30}{off:10.1f}{on:10.1f}{(on - off) / off * 100:9.1f}%")
+
+        print()
+        for name, stats in instrumentation.snapshot()["helpers"].items():
+            print(f"{name:<30}{stats['calls']:>6} calls{stats['statements'] / max(stats['calls'], 1):6.1f} stmts/call"
+                  f"  p50 {stats['p50_ms']:.3f} ms  p99 {stats['p99_ms']:.3f} ms")
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
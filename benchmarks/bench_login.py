@@ -0,0 +1,79 @@
+# benchmarks/bench_login.py
+"""Time password hashing at a few work factors and check that concurrent logins do not serialize.
+
+Creates users in a fresh SQLite file, then logs them in from 1, 2, 4 and 8
+threads. hashlib releases the GIL while deriving a key, so throughput should
+grow with the thread count up to the number of cores.
+
+    python benchmarks/bench_login.py --users 32
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import create_engine, insert
+
+import connection
+import passwords
+from connection import User
+
+
+def time_hashes(repeat):
+    settings = [("scrypt", "log2_n", value) for value in (14, 15, 16)]
+    settings += [("pbkdf2_sha256", "iterations", value) for value in (200000, 600000)]
+    for scheme, name, value in settings:
+        if scheme == "scrypt":
+            passwords.SCRYPT_LOG2_N = value
+        else:
+            passwords.PBKDF2_ITERATIONS = value
+        start = time.perf_counter()
+        for _ in range(repeat):
+            passwords.hash_password("correct horse", scheme)
+        label = f"{scheme} {name}={value}:"
+        print(f"{label:<34}{(time.perf_counter() - start) / repeat * 1000:8.1f} ms per hash")
+    passwords.SCRYPT_LOG2_N = 14
+    passwords.PBKDF2_ITERATIONS = 600000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--users", type=int, default=32)
+    parser.add_argument("--repeat", type=int, default=5, help="hashes timed per work factor")
+    args = parser.parse_args()
+
+    time_hashes(args.repeat)
+    print()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_engine(f"sqlite:///{os.path.join(tmp, 'bench.db')}")
+        connection.bootstrap_schema(engine)
+        connection.configure_engine(engine)
+
+        # Every user shares one hash; each login still pays for a full derivation
+        stored = passwords.hash_password("secret")
+        with engine.begin() as conn:
+            conn.execute(insert(User), [
+                {"username": f"user{i}", "password": stored, "is_admin": False} for i in range(args.users)
+            ])
+
+        baseline = None
+        for threads in (1, 2, 4, 8):
+            start = time.perf_counter()
+            with ThreadPoolExecutor(threads) as pool:
+                results = list(pool.map(lambda i: connection.login_user(f"user{i}", "secret"), range(args.users)))
+            elapsed = time.perf_counter() - start
+            assert all(results)
+            rate = args.users / elapsed
+            baseline = baseline or rate
+            label = f"{threads} thread(s):"
+            print(f"{label:<34}{rate:8.1f} logins/s  ({rate / baseline:.1f}x)")
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+# benchmarks/bench_pagination.py
+"""Compare loading every user against keyset and OFFSET pages.
+
+Seeds a SQLite file with synthetic users, then times get_all_users() (with its
+peak Python memory), get_users_page() at the start and deep into the table,
+and the same deep page fetched with LIMIT/OFFSET for contrast.
+
+    python benchmarks/bench_pagination.py --users 1000000
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import create_engine, insert, select
+
+import connection
+from connection import User
+
+CHUNK = 50000
+
+
+def seed(engine, n_users):
+    for start in range(1, n_users + 1, CHUNK):
+        with engine.begin() as conn:
+            conn.execute(insert(User), [
+                {"user_id": i, "username": f"user{i}", "password": "x" * 12, "is_admin": False}
+                for i in range(start, min(start + CHUNK, n_users + 1))
+            ])
+
+
+def timed(func, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        result = func()
+    return (time.perf_counter() - start) / repeat * 1000, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--users", type=int, default=1000000)
+    parser.add_argument("--page-size", type=int, default=200)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_engine(f"sqlite:///{os.path.join(tmp, 'bench.db')}")
+        connection.bootstrap_schema(engine)
+        connection.configure_engine(engine)
+        seed(engine, args.users)
+
+        tracemalloc.start()
+        elapsed, users = timed(connection.get_all_users, 1)
+        peak = tracemalloc.get_traced_memory()[1] / 2 ** 20
+        tracemalloc.stop()
+        print(f"get_all_users():            {elapsed:9.1f} ms  peak {peak:7.1f} MiB  ({len(users)} rows)")
+        del users
+
+        deep = args.users - args.page_size * 2
+        tracemalloc.start()
+        elapsed, _ = timed(lambda: connection.get_users_page(None, args.page_size), args.repeat)
+        peak = tracemalloc.get_traced_memory()[1] / 2 ** 20
+        tracemalloc.stop()
+        print(f"first page (keyset):        {elapsed:9.3f} ms  peak {peak:7.1f} MiB")
+
+        elapsed, _ = timed(lambda: connection.get_users_page(deep, args.page_size), args.repeat)
+        print(f"{f'page at row {deep} (keyset):':<28}{elapsed:9.3f} ms")
+
+        offset_query = select(User.user_id, User.username, User.password).order_by(User.user_id) \
+            .limit(args.page_size).offset(deep)
+        with engine.connect() as conn:
+            elapsed, _ = timed(lambda: conn.execute(offset_query).all(), args.repeat)
+        print(f"{f'page at row {deep} (OFFSET):':<28}{elapsed:9.3f} ms")
+
+        elapsed, _ = timed(lambda: connection.get_users_page(None, args.page_size, with_total=True), args.repeat)
+        print(f"first page with total:      {elapsed:9.3f} ms")
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+# benchmarks/bench_pnr.py
+"""Generate PNRs through connection.generate_pnr() and check they are unique.
+
+A single-threaded run of --count PNRs (10M by default) must be strictly
+increasing, which implies uniqueness without holding them all in memory. A
+second, multi-threaded run collects every PNR in a set to check that blocks
+handed to concurrent callers never overlap.
+
+Uses a throwaway SQLite file unless FASTLINK_DB_URL points elsewhere.
+
+    python benchmarks/bench_pnr.py --count 10000000 --block-size 10000
+"""
+import argparse
+import os
+import sys
+import tempfile
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+_tmp_dir = tempfile.mkdtemp()
+os.environ.setdefault("FASTLINK_DB_URL", f"sqlite:///{os.path.join(_tmp_dir, 'pnr.db')}")
+
+import connection
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=10000000)
+    parser.add_argument("--block-size", type=int, default=10000)
+    parser.add_argument("--threads", type=int, default=8)
+    parser.add_argument("--threaded-count", type=int, default=1000000)
+    args = parser.parse_args()
+
+    connection.bootstrap_schema()
+    reservations = []
+
+    def counting_reserve(block_size):
+        reservations.append(block_size)
+        return connection._reserve_pnr_block(block_size)
+
+    allocator = connection.PnrAllocator(block_size=args.block_size, reserve_block=counting_reserve)
+
+    previous = ""
+    start = time.perf_counter()
+    for _ in range(args.count):
+        pnr = allocator.next_pnr()
+        if pnr <= previous:
+            sys.exit(f"PNR {pnr} is not greater than {previous}")
+        previous = pnr
+    elapsed = time.perf_counter() - start
+    print(f"single thread:  {args.count} PNRs in {elapsed:.2f} s "
+          f"({args.count / elapsed:,.0f}/s, {len(reservations)} block reservations)")
+
+    seen = set()
+    seen_lock = threading.Lock()
+    per_thread = args.threaded_count // args.threads
+
+    def worker():
+        local = [allocator.next_pnr() for _ in range(per_thread)]
+        with seen_lock:
+            seen.update(local)
+
+    threads = [threading.Thread(target=worker) for _ in range(args.threads)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+    total = per_thread * args.threads
+    print(f"{args.threads} threads:      {total} PNRs in {elapsed:.2f} s ({total / elapsed:,.0f}/s)")
+    print(f"duplicates:     {total - len(seen)}")
+    sys.exit(1 if len(seen) != total else 0)
+
+
+if __name__ == "__main__":
+    main()
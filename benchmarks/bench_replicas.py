@@ -0,0 +1,126 @@
+# benchmarks/bench_replicas.py
+"""Show read-only helpers spreading over read replicas, and falling back when one fails.
+
+The primary and replicas are copies of one SQLite file whose cursors sleep for
+--latency-ms per statement, each engine with a small connection pool, so a
+single database saturates. Threads run route searches and PNR lookups with
+0, 1 and 2 replicas configured; one replica is then broken mid-run.
+
+    python benchmarks/bench_replicas.py --threads 32 --ops 3000
+"""
+import argparse
+import os
+import random
+import shutil
+import sqlite3
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, time as dtime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import create_engine, insert
+
+import connection
+from connection import Station, Train, User
+
+TRAVEL_DATE = date(2030, 1, 7)
+LATENCY = 0.005
+
+
+class LatencyCursor(sqlite3.Cursor):
+    def execute(self, *args):
+        time.sleep(LATENCY)
+        return super().execute(*args)
+
+
+class LatencyConnection(sqlite3.Connection):
+    def cursor(self, factory=LatencyCursor):
+        return super().cursor(factory)
+
+
+def make_engine(path, pool_size):
+    return create_engine(f"sqlite:///{path}", pool_size=pool_size, max_overflow=0, pool_timeout=300,
+                         connect_args={"factory": LatencyConnection, "check_same_thread": False})
+
+
+def seed(path):
+    engine = create_engine(f"sqlite:///{path}")
+    connection.bootstrap_schema(engine)
+    rng = random.Random(3)
+    with engine.begin() as conn:
+        conn.execute(insert(Station), [{"station_id": i, "station_name": f"Station {i}", "code": f"S{i}"}
+                                       for i in range(1, 51)])
+        conn.execute(insert(Train), [
+            {"train_id": i, "train_number": f"T{i}", "train_name": f"Express {i}", "source_id": rng.randint(1, 20),
+             "destination_id": rng.randint(1, 20), "departure_time": dtime(i % 24, 0),
+             "arrival_time": dtime((i + 5) % 24, 0), "travel_days": "Daily"}
+            for i in range(1, 2001)
+        ])
+        conn.execute(insert(User), [{"user_id": 1, "username": "agent", "password": "x", "is_admin": False}])
+    connection.configure_engine(engine)
+    pnrs = [connection.book_ticket(1, i, TRAVEL_DATE, date.today(), [{"name": "P", "age": 30, "gender": "F"}])[1]
+            for i in range(1, 101)]
+    engine.dispose()
+    return pnrs
+
+
+def read(rng, pnrs):
+    if rng.random() < 0.6:
+        connection.search_train_by_location(f"Station {rng.randint(1, 20)}", f"S{rng.randint(1, 20)}")
+    else:
+        connection.get_booking_by_pnr(rng.choice(pnrs))
+
+
+def run(label, ops, threads, pnrs, before=None):
+    rngs = [random.Random(i) for i in range(ops)]
+    start = time.perf_counter()
+    with ThreadPoolExecutor(threads) as pool:
+        futures = [pool.submit(read, rng, pnrs) for rng in rngs]
+        if before:
+            time.sleep(0.2)
+            before()
+        errors = sum(1 for future in futures if future.exception() is not None)
+    elapsed = time.perf_counter() - start
+    spread = ", ".join(f"{os.path.basename(str(r['url']))}: {'up' if r['healthy'] else 'down'}"
+                       for r in connection.replica_router.status())
+    print(f"{label:<34}{ops / elapsed:8.0f} reads/s  {errors} errors  {spread}")
+
+
+def main():
+    global LATENCY
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--threads", type=int, default=32)
+    parser.add_argument("--ops", type=int, default=3000)
+    parser.add_argument("--pool-size", type=int, default=4, help="connections per database")
+    parser.add_argument("--latency-ms", type=float, default=5.0)
+    args = parser.parse_args()
+    LATENCY = args.latency_ms / 1000
+
+    with tempfile.TemporaryDirectory() as tmp:
+        primary_path = os.path.join(tmp, "primary.db")
+        pnrs = seed(primary_path)
+        replica_paths = [os.path.join(tmp, f"replica{i}.db") for i in (1, 2)]
+        for path in replica_paths:
+            shutil.copy(primary_path, path)
+
+        connection.configure_engine(make_engine(primary_path, args.pool_size))
+        for count in (0, 1, 2):
+            connection.replica_router.configure([make_engine(path, args.pool_size) for path in replica_paths[:count]],
+                                                check_interval=1.0, read_your_writes_window=0)
+            run(f"primary + {count} replica(s)", args.ops, args.threads, pnrs)
+
+        def break_replica():
+            conn = sqlite3.connect(replica_paths[0])
+            conn.execute("ALTER TABLE trains RENAME TO trains_gone")
+            conn.commit()
+            conn.close()
+
+        run("replica1 broken during the run", args.ops, args.threads, pnrs, before=break_replica)
+        connection.replica_router.configure([])
+
+
+if __name__ == "__main__":
+    main()
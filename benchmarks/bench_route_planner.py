@@ -0,0 +1,71 @@
+# benchmarks/bench_route_planner.py
+"""Time multi-leg route searches over a synthetic timetable.
+
+Builds a RouteGraph straight from generated legs (no database), then runs
+random source/destination queries allowing up to two changes.
+
+    python benchmarks/bench_route_planner.py --stations 3000 --trains 40000
+"""
+import argparse
+import os
+import random
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from route_planner import Leg, RouteGraph
+
+
+def build_legs(n_stations, n_trains, rng):
+    # Mostly short hops between nearby stations plus some long-distance trains
+    legs = []
+    for train_id in range(1, n_trains + 1):
+        source = rng.randint(1, n_stations)
+        spread = 20 if rng.random() < 0.8 else n_stations
+        destination = (source + rng.randint(1, spread)) % n_stations + 1
+        legs.append(Leg(train_id, f"T{train_id}", f"Express {train_id}", source, destination,
+                        rng.randint(0, 24 * 60 - 1), rng.randint(30, 16 * 60)))
+    return legs
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--stations", type=int, default=3000)
+    parser.add_argument("--trains", type=int, default=40000)
+    parser.add_argument("--queries", type=int, default=500)
+    parser.add_argument("--max-changes", type=int, default=2)
+    args = parser.parse_args()
+
+    rng = random.Random(3)
+    legs = build_legs(args.stations, args.trains, rng)
+
+    start = time.perf_counter()
+    graph = RouteGraph(legs)
+    print(f"built graph of {len(graph)} trains in {(time.perf_counter() - start) * 1000:.0f} ms")
+
+    start = time.perf_counter()
+    for leg in legs[:1000]:
+        graph.add_leg(leg._replace(departure=(leg.departure + 5) % (24 * 60)))
+    print(f"incremental update: {(time.perf_counter() - start) * 1000 / 1000:.3f} ms per train")
+
+    timings = []
+    found = 0
+    for _ in range(args.queries):
+        source, destination = rng.randint(1, args.stations), rng.randint(1, args.stations)
+        begin = time.perf_counter()
+        journeys = graph.search(source, destination, depart_after=rng.randint(0, 24 * 60 - 1),
+                                max_changes=args.max_changes)
+        timings.append((time.perf_counter() - begin) * 1000)
+        found += bool(journeys)
+
+    timings.sort()
+    print(f"queries:            {args.queries} ({found} with a route)")
+    print(f"median:             {statistics.median(timings):.2f} ms")
+    print(f"p95:                {timings[int(len(timings) * 0.95) - 1]:.2f} ms")
+    print(f"max:                {timings[-1]:.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
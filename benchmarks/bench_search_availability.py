@@ -0,0 +1,106 @@
+# benchmarks/bench_search_availability.py
+"""Compare seats-left in route search from the seat inventory against a live ticket count.
+
+Seeds a SQLite file with --trains trains on one route, each holding --bookings
+confirmed bookings of two passengers on the travel date, then times
+search_train_by_location (which reads the seat_inventory counters in its one
+query) against the same search followed by a COUNT over tickets joined to
+bookings. Finally times reconcile_seat_inventory over the seeded data.
+
+    python benchmarks/bench_search_availability.py --trains 200 --bookings 200
+"""
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+from datetime import date, time as dtime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import create_engine, func, insert
+
+import connection
+from connection import Booking, SeatInventory, Station, Ticket, Train, User
+
+TRAVEL_DATE = date(2030, 1, 7)
+
+
+def seed(engine, n_trains, n_bookings):
+    connection.bootstrap_schema(engine)
+    with engine.begin() as conn:
+        conn.execute(insert(Station), [{"station_id": i, "station_name": f"Station {i}", "code": f"S{i}"}
+                                       for i in (1, 2)])
+        conn.execute(insert(Train), [
+            {"train_id": i, "train_number": f"T{i}", "train_name": f"Express {i}", "source_id": 1,
+             "destination_id": 2, "departure_time": dtime(i % 24, 0), "arrival_time": dtime((i + 5) % 24, 0),
+             "travel_days": "Daily", "capacity": 1000000}
+            for i in range(1, n_trains + 1)
+        ])
+        conn.execute(insert(User), [{"user_id": 1, "username": "agent", "password": "x", "is_admin": False}])
+        bookings = [
+            {"booking_id": train_id * n_bookings + i, "user_id": 1, "train_id": train_id,
+             "pnr_number": f"{train_id * n_bookings + i:010d}", "booking_date": date.today(),
+             "travel_date": TRAVEL_DATE, "status": "Confirmed"}
+            for train_id in range(1, n_trains + 1) for i in range(n_bookings)
+        ]
+        conn.execute(insert(Booking), bookings)
+        conn.execute(insert(Ticket), [{"booking_id": b["booking_id"], "passenger_name": "P", "age": 30, "gender": g}
+                                      for b in bookings for g in ("F", "M")])
+        conn.execute(insert(SeatInventory), [{"train_id": train_id, "travel_date": TRAVEL_DATE,
+                                              "capacity": 1000000, "booked": 2 * n_bookings}
+                                             for train_id in range(1, n_trains + 1)])
+
+
+def search_with_live_count():
+    trains = connection.search_train_by_location("Station 1", "Station 2", TRAVEL_DATE)
+    session = connection.Session()
+    try:
+        counts = dict(
+            session.query(Booking.train_id, func.count(Ticket.ticket_id))
+            .join(Ticket, Ticket.booking_id == Booking.booking_id)
+            .filter(Booking.train_id.in_([train["train_id"] for train in trains]),
+                    Booking.travel_date == TRAVEL_DATE, Booking.status == "Confirmed")
+            .group_by(Booking.train_id)
+        )
+    finally:
+        session.close()
+    return [dict(train, seats_available=1000000 - counts.get(train["train_id"], 0)) for train in trains]
+
+
+def time_calls(func, calls):
+    samples = []
+    for _ in range(calls):
+        start = time.perf_counter()
+        func()
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--trains", type=int, default=200)
+    parser.add_argument("--bookings", type=int, default=200, help="bookings per train")
+    parser.add_argument("--calls", type=int, default=50)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_engine(f"sqlite:///{os.path.join(tmp, 'bench.db')}")
+        seed(engine, args.trains, args.bookings)
+        connection.configure_engine(engine)
+        search = lambda: connection.search_train_by_location("Station 1", "Station 2", TRAVEL_DATE)
+        assert search() == search_with_live_count()
+
+        print(f"{args.trains} trains x {args.bookings} bookings on the route\n")
+        print(f"{'search, seat inventory join':<34}{time_calls(search, args.calls):8.2f} ms")
+        print(f"{'search + live ticket count':<34}{time_calls(search_with_live_count, args.calls):8.2f} ms")
+        start = time.perf_counter()
+        drift = connection.reconcile_seat_inventory(TRAVEL_DATE)
+        print(f"{'reconcile_seat_inventory':<34}{(time.perf_counter() - start) * 1000:8.2f} ms"
+              f"  ({len(drift)} drifted)")
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
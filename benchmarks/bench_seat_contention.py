@@ -0,0 +1,122 @@
+# benchmarks/bench_seat_contention.py
+"""Race concurrent book_ticket() calls for the last seats on one train and date.
+
+Every thread keeps booking 1-4 passengers until the train is full. Afterwards
+the seat counter and the confirmed tickets are checked against capacity; any
+oversell makes the script exit non-zero.
+
+Uses a throwaway SQLite file unless FASTLINK_DB_URL points elsewhere (use an
+empty database: the script creates its own train).
+
+    python benchmarks/bench_seat_contention.py --threads 200 --capacity 500
+"""
+import argparse
+import os
+import random
+import sys
+import tempfile
+import threading
+import time
+from datetime import date, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+_tmp_dir = tempfile.mkdtemp()
+os.environ.setdefault("FASTLINK_DB_URL", f"sqlite:///{os.path.join(_tmp_dir, 'contention.db')}")
+os.environ.setdefault("FASTLINK_DB_POOL_SIZE", "50")
+os.environ.setdefault("FASTLINK_DB_MAX_OVERFLOW", "200")
+
+import connection
+from connection import Booking, SeatInventory, Session, Station, Ticket, Train, User
+
+
+def setup(capacity):
+    connection.bootstrap_schema()
+    session = Session()
+    try:
+        session.add_all([
+            Station(station_name="Bench Source", code="BSRC"),
+            Station(station_name="Bench Destination", code="BDST"),
+            User(username="bench_user", password="x", is_admin=False),
+        ])
+        session.flush()
+        train = Train(train_number="BENCH1", train_name="Contention Express",
+                      source_id=1, destination_id=2,
+                      departure_time=connection.time(6, 0), arrival_time=connection.time(12, 0),
+                      travel_days="Daily", capacity=capacity)
+        session.add(train)
+        user = session.query(User).filter_by(username="bench_user").one()
+        session.commit()
+        return train.train_id, user.user_id
+    finally:
+        session.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--threads", type=int, default=200)
+    parser.add_argument("--capacity", type=int, default=500)
+    args = parser.parse_args()
+
+    train_id, user_id = setup(args.capacity)
+    travel_date = date.today() + timedelta(days=30)
+
+    lock = threading.Lock()
+    counts = {"booked": 0, "seats": 0, "sold_out": 0, "errors": 0}
+    start_barrier = threading.Barrier(args.threads)
+
+    def worker(seed):
+        rng = random.Random(seed)
+        start_barrier.wait()
+        while True:
+            passengers = [{"name": f"P{seed}", "age": 30, "gender": "F"} for _ in range(rng.randint(1, 4))]
+            try:
+                connection.book_ticket(user_id, train_id, travel_date, date.today(), passengers)
+            except ValueError:
+                with lock:
+                    counts["sold_out"] += 1
+                if len(passengers) == 1:
+                    return
+                continue
+            except Exception as e:
+                with lock:
+                    counts["errors"] += 1
+                print(f"unexpected error: {e}", file=sys.stderr)
+                return
+            with lock:
+                counts["booked"] += 1
+                counts["seats"] += len(passengers)
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(args.threads)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+
+    session = Session()
+    try:
+        inventory = session.query(SeatInventory).filter_by(train_id=train_id, travel_date=travel_date).one()
+        tickets = session.query(Ticket).join(Booking).filter(
+            Booking.train_id == train_id, Booking.travel_date == travel_date,
+            Booking.status == "Confirmed").count()
+    finally:
+        session.close()
+
+    print(f"threads:          {args.threads}")
+    print(f"capacity:         {args.capacity}")
+    print(f"bookings:         {counts['booked']} ({counts['seats']} seats)")
+    print(f"rejected:         {counts['sold_out']} sold out, {counts['errors']} errors")
+    print(f"elapsed:          {elapsed:.2f} s")
+    print(f"bookings/sec:     {counts['booked'] / elapsed:.1f}")
+    print(f"counter booked:   {inventory.booked}")
+    print(f"tickets in db:    {tickets}")
+
+    oversold = inventory.booked > args.capacity or tickets > args.capacity or tickets != inventory.booked
+    print("oversells:        " + ("FOUND" if oversold else "none"))
+    sys.exit(1 if oversold or counts["errors"] else 0)
+
+
+if __name__ == "__main__":
+    main()
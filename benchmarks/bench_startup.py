@@ -0,0 +1,76 @@
+# benchmarks/bench_startup.py
+"""Measure `import connection` time and the GUI's time to first window.
+
+Each sample runs in a fresh interpreter. The GUI sample replaces Tk's mainloop
+with a hook that maps the window once and exits, so it needs a display.
+
+    python benchmarks/bench_startup.py --repeat 10
+    FASTLINK_DB_URL=mysql+mysqlconnector://user:pw@slow-host/fastlink python benchmarks/bench_startup.py
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+FIRST_WINDOW_SCRIPT = """
+import runpy
+import tkinter
+
+def mainloop(self, n=0):
+    self.update()
+    print("window-ready", flush=True)
+    self.destroy()
+
+tkinter.Misc.mainloop = mainloop
+runpy.run_path("gui.py", run_name="__main__")
+"""
+
+
+def run_sample(code, marker=None):
+    """Return wall-clock seconds until the child exits (or prints marker)."""
+    start = time.perf_counter()
+    proc = subprocess.Popen([sys.executable, "-c", code], cwd=REPO_DIR,
+                            stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
+    elapsed = None
+    if marker:
+        for line in proc.stdout:
+            if line.strip() == marker:
+                elapsed = time.perf_counter() - start
+                break
+    _, stderr = proc.communicate()
+    if elapsed is None:
+        elapsed = time.perf_counter() - start
+    if proc.returncode != 0:
+        raise RuntimeError(stderr.strip().splitlines()[-1] if stderr.strip() else "child process failed")
+    return elapsed
+
+
+def report(label, samples):
+    samples_ms = [s * 1000 for s in samples]
+    print(f"{label:<24} min {min(samples_ms):8.1f} ms   median {statistics.median(samples_ms):8.1f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+
+    report("python -c 'import connection'",
+           [run_sample("import connection") for _ in range(args.repeat)])
+    report("python -c 'import sqlalchemy'",
+           [run_sample("import sqlalchemy") for _ in range(args.repeat)])
+
+    try:
+        samples = [run_sample(FIRST_WINDOW_SCRIPT, marker="window-ready") for _ in range(args.repeat)]
+    except RuntimeError as e:
+        print(f"time to first window     skipped ({e})")
+    else:
+        report("time to first window", samples)
+
+
+if __name__ == "__main__":
+    main()
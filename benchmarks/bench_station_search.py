@@ -0,0 +1,90 @@
+# benchmarks/bench_station_search.py
+"""Time prefix suggestions and fuzzy station lookups over a synthetic station list.
+
+Builds a StationIndex straight from generated names (no database) and times
+the lookups behind the search form's autocomplete: short prefixes, longer
+prefixes, and names with a typo.
+
+    python benchmarks/bench_station_search.py --stations 20000
+"""
+import argparse
+import os
+import random
+import statistics
+import string
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from connection import StationEntry
+from station_index import StationIndex
+
+CONSONANTS = "bcdghjklmnprstvwy"
+VOWELS = "aeiou"
+SUFFIXES = ["", " Junction", " City", " Cantt", " Road", " Central", " Town"]
+
+
+def build_stations(n_stations, rng):
+    stations = []
+    names = set()
+    codes = set()
+    while len(stations) < n_stations:
+        # Consonant-vowel(-consonant) syllables give names roughly as varied as real ones
+        name = "".join(rng.choice(CONSONANTS) + rng.choice(VOWELS) + rng.choice(["", "", rng.choice(CONSONANTS)])
+                       for _ in range(rng.randint(2, 4))).capitalize() + rng.choice(SUFFIXES)
+        if name in names:
+            continue
+        code = "".join(rng.choice(string.ascii_uppercase) for _ in range(rng.randint(2, 4)))
+        if code in codes:
+            continue
+        names.add(name)
+        codes.add(code)
+        stations.append(StationEntry(len(stations) + 1, name, code))
+    return stations
+
+
+def typo(name, rng):
+    position = rng.randrange(len(name))
+    return name[:position] + rng.choice(string.ascii_lowercase) + name[position + 1:]
+
+
+def time_queries(label, func, queries):
+    timings = []
+    for query in queries:
+        start = time.perf_counter()
+        func(query)
+        timings.append((time.perf_counter() - start) * 1000)
+    timings.sort()
+    print(f"{label:<26}{statistics.median(timings):>9.3f} ms{timings[int(len(timings) * 0.95) - 1]:>9.3f} ms"
+          f"{timings[-1]:>9.3f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--stations", type=int, default=20000)
+    parser.add_argument("--queries", type=int, default=2000)
+    args = parser.parse_args()
+
+    rng = random.Random(5)
+    stations = build_stations(args.stations, rng)
+
+    start = time.perf_counter()
+    index = StationIndex()
+    for station in stations:
+        index.add(station)
+    print(f"indexed {len(index)} stations in {(time.perf_counter() - start) * 1000:.0f} ms")
+
+    sample = [rng.choice(stations).station_name for _ in range(args.queries)]
+    print(f"\n{'lookup':<26}{'median':>12}{'p95':>12}{'max':>12}")
+    time_queries("suggest, 2-letter prefix", index.suggest, [name[:2] for name in sample])
+    time_queries("suggest, 5-letter prefix", index.suggest, [name[:5] for name in sample])
+    time_queries("suggest, typo", index.suggest, [typo(name, rng) for name in sample])
+    time_queries("unique prefix, 5-letter", index.unique_prefix, [name[:5] for name in sample])
+
+    hits = sum(any(entry.station_name == name for entry in index.suggest(typo(name, rng), 3)) for name in sample)
+    print(f"\ntypos with the station in the top 3 suggestions: {hits}/{len(sample)}")
+
+
+if __name__ == "__main__":
+    main()
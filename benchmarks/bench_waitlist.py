@@ -0,0 +1,164 @@
+# benchmarks/bench_waitlist.py
+"""Stress the waitlist with concurrent bookings and cancellations on one train and date.
+
+Every thread books 1-3 passengers with allow_waitlist=True or cancels a random
+earlier booking, --ops times. Afterwards the script checks that the seat counter
+matches confirmed tickets and capacity, that the waitlist holds exactly the
+'Waitlisted' bookings, and that no waitlisted party was left out while its seats
+were free; any violation makes it exit non-zero.
+
+Uses a throwaway SQLite file unless FASTLINK_DB_URL points elsewhere (use an
+empty database: the script creates its own train).
+
+    python benchmarks/bench_waitlist.py --threads 50 --ops 40 --capacity 100
+"""
+import argparse
+import os
+import random
+import sys
+import tempfile
+import threading
+import time
+from datetime import date, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+_tmp_dir = tempfile.mkdtemp()
+os.environ.setdefault("FASTLINK_DB_URL", f"sqlite:///{os.path.join(_tmp_dir, 'waitlist.db')}")
+os.environ.setdefault("FASTLINK_DB_POOL_SIZE", "50")
+os.environ.setdefault("FASTLINK_DB_MAX_OVERFLOW", "200")
+
+from sqlalchemy import func
+from sqlalchemy.exc import OperationalError
+
+import connection
+from connection import Booking, SeatInventory, Session, Station, Ticket, Train, User, WaitlistEntry
+
+
+def setup(capacity):
+    connection.bootstrap_schema()
+    session = Session()
+    try:
+        session.add_all([
+            Station(station_name="Bench Source", code="BSRC"),
+            Station(station_name="Bench Destination", code="BDST"),
+            User(username="bench_user", password="x", is_admin=False),
+        ])
+        session.flush()
+        train = Train(train_number="WAIT1", train_name="Waitlist Express",
+                      source_id=1, destination_id=2,
+                      departure_time=connection.time(6, 0), arrival_time=connection.time(12, 0),
+                      travel_days="Daily", capacity=capacity)
+        session.add(train)
+        user = session.query(User).filter_by(username="bench_user").one()
+        session.commit()
+        return train.train_id, user.user_id
+    finally:
+        session.close()
+
+
+def check(train_id, travel_date, capacity):
+    """Return a list of invariant violations for the train and date."""
+    session = Session()
+    try:
+        inventory = session.query(SeatInventory).filter_by(train_id=train_id, travel_date=travel_date).one()
+        seats = dict(
+            session.query(Booking.status, func.count(Ticket.ticket_id))
+            .join(Ticket, Ticket.booking_id == Booking.booking_id)
+            .filter(Booking.train_id == train_id, Booking.travel_date == travel_date)
+            .group_by(Booking.status)
+        )
+        waitlisted = {booking_id for booking_id, in session.query(Booking.booking_id).filter_by(
+            train_id=train_id, travel_date=travel_date, status="Waitlisted")}
+        entries = session.query(WaitlistEntry).filter_by(train_id=train_id, travel_date=travel_date).all()
+    finally:
+        session.close()
+
+    problems = []
+    free = inventory.capacity - inventory.booked
+    if inventory.booked != seats.get("Confirmed", 0):
+        problems.append(f"counter {inventory.booked} != {seats.get('Confirmed', 0)} confirmed seats")
+    if inventory.booked > capacity:
+        problems.append(f"oversold: {inventory.booked} booked of {capacity}")
+    if {entry.booking_id for entry in entries} != waitlisted:
+        problems.append("waitlist entries do not match 'Waitlisted' bookings")
+    if sum(entry.seats for entry in entries) != seats.get("Waitlisted", 0):
+        problems.append("waitlist seat counts do not match waitlisted tickets")
+    if any(entry.seats <= free for entry in entries):
+        problems.append(f"{free} seat(s) free while a waitlisted party fits")
+    return problems, seats, len(entries)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--threads", type=int, default=50)
+    parser.add_argument("--ops", type=int, default=40, help="operations per thread")
+    parser.add_argument("--capacity", type=int, default=100)
+    parser.add_argument("--cancel-share", type=float, default=0.4, help="fraction of operations that cancel")
+    args = parser.parse_args()
+
+    train_id, user_id = setup(args.capacity)
+    travel_date = date.today() + timedelta(days=30)
+
+    lock = threading.Lock()
+    pnrs = []
+    counts = {"booked": 0, "cancelled": 0, "errors": 0, "lock_retries": 0}
+    start_barrier = threading.Barrier(args.threads)
+
+    def attempt(op, *args, **kwargs):
+        # SQLite refuses a read-to-write lock upgrade while another connection commits; retry like a client would
+        for _ in range(5):
+            try:
+                return op(*args, **kwargs)
+            except OperationalError as e:
+                if "database is locked" not in str(e):
+                    raise
+                with lock:
+                    counts["lock_retries"] += 1
+        return op(*args, **kwargs)
+
+    def worker(seed):
+        rng = random.Random(seed)
+        start_barrier.wait()
+        for _ in range(args.ops):
+            try:
+                if rng.random() < args.cancel_share:
+                    with lock:
+                        pnr = pnrs.pop(rng.randrange(len(pnrs))) if pnrs else None
+                    if pnr and attempt(connection.cancel_ticket, pnr, "Plans changed", date.today()):
+                        with lock:
+                            counts["cancelled"] += 1
+                    continue
+                passengers = [{"name": f"P{seed}", "age": 30, "gender": "F"} for _ in range(rng.randint(1, 3))]
+                _, pnr, _ = attempt(connection.book_ticket, user_id, train_id, travel_date, date.today(), passengers,
+                                 allow_waitlist=True)
+                with lock:
+                    pnrs.append(pnr)
+                    counts["booked"] += 1
+            except Exception as e:
+                with lock:
+                    counts["errors"] += 1
+                print(f"unexpected error: {e}", file=sys.stderr)
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(args.threads)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+
+    problems, seats, queued = check(train_id, travel_date, args.capacity)
+    print(f"threads:          {args.threads}")
+    print(f"capacity:         {args.capacity}")
+    print(f"bookings:         {counts['booked']}, cancellations: {counts['cancelled']}, errors: {counts['errors']}"
+          f" ({counts['lock_retries']} SQLite lock retries)")
+    print(f"elapsed:          {elapsed:.2f} s ({(counts['booked'] + counts['cancelled']) / elapsed:.1f} ops/sec)")
+    print(f"seats:            {seats.get('Confirmed', 0)} confirmed, {seats.get('Waitlisted', 0)} waitlisted "
+          f"in {queued} queue entries, {seats.get('Cancelled', 0)} cancelled")
+    print("violations:       " + ("; ".join(problems) if problems else "none"))
+    sys.exit(1 if problems or counts["errors"] else 0)
+
+
+if __name__ == "__main__":
+    main()
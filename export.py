@@ -0,0 +1,181 @@
+# export.py
+import csv
+import os
+from datetime import datetime
+
+from sqlalchemy import select, tuple_
+
+from connection import Booking, Ticket, Train, read_session, station_catalog
+
+try:
+    import pyarrow
+    import pyarrow.parquet
+except ImportError:  # Parquet export is optional
+    pyarrow = None
+
+# Bookings per keyset page; a batch holds their tickets, so a few times as many rows
+EXPORT_BATCH_SIZE = 10000
+
+MANIFEST_COLUMNS = [
+    'train_number', 'train_name', 'source', 'destination', 'travel_date', 'pnr_number',
+    'booking_date', 'status', 'ticket_id', 'passenger_name', 'age', 'gender'
+]
+
+# A manifest is one train on one travel date; ix_bookings_travel_date_train serves this order
+MANIFEST_GROUP = (Booking.travel_date, Booking.train_id)
+
+def _booking_filters(train_id, start_date, end_date, status):
+    filters = []
+    if train_id is not None:
+        filters.append(Booking.train_id == train_id)
+    if start_date is not None:
+        filters.append(Booking.travel_date >= start_date)
+    if end_date is not None:
+        filters.append(Booking.travel_date <= end_date)
+    if status is not None:
+        filters.append(Booking.status == status)
+    return filters
+
+def manifest_query(train_id=None, start_date=None, end_date=None, status=None):
+    """Passenger manifest rows (one per ticket), ordered by travel date, train and ticket."""
+    return (
+        select(
+            Train.train_number, Train.train_name, Train.source_id, Train.destination_id,
+            Booking.travel_date, Booking.pnr_number, Booking.booking_date, Booking.status,
+            Ticket.ticket_id, Ticket.passenger_name, Ticket.age, Ticket.gender
+        )
+        .join(Booking, Ticket.booking_id == Booking.booking_id)
+        .join(Train, Booking.train_id == Train.train_id)
+        .where(*_booking_filters(train_id, start_date, end_date, status))
+        .order_by(*MANIFEST_GROUP, Ticket.ticket_id)
+    )
+
+def iter_manifest_batches(train_id=None, start_date=None, end_date=None, status=None,
+                          batch_size=EXPORT_BATCH_SIZE):
+    """Yield lists of manifest rows (tuples in MANIFEST_COLUMNS order).
+
+    Each page covers whole (travel_date, train_id) groups. The next batch_size
+    bookings are read off ix_bookings_travel_date_train to find where the page
+    ends; then the tickets of the groups up to and including that booking's are
+    fetched and sorted, which touches only those rows. The last group is read
+    whole even if it holds more bookings, so a page is at most batch_size
+    bookings plus one train's bookings for one day. Only one page is held in
+    memory however many tickets match, and no server-side cursor is needed,
+    which mysql-connector does not provide. All pages are read in one
+    transaction, a consistent snapshot under MySQL's default REPEATABLE READ.
+    """
+    # Station names are resolved from the in-memory catalog rather than joined
+    names = {entry.station_id: entry.station_name for entry in station_catalog.all()}
+    filters = _booking_filters(train_id, start_date, end_date, status)
+    query = manifest_query(train_id, start_date, end_date, status)
+    with read_session() as session:
+        # Core rows on the session's connection; ORM entity loading would dominate the cost
+        connection = session.connection()
+        last_group = None
+        while True:
+            boundary = select(*MANIFEST_GROUP).where(*filters).order_by(*MANIFEST_GROUP)
+            if last_group is not None:
+                boundary = boundary.where(tuple_(*MANIFEST_GROUP) > tuple_(*last_group))
+            groups = connection.execute(boundary.limit(batch_size)).all()
+            if not groups:
+                break
+            page = query.where(tuple_(*MANIFEST_GROUP) <= tuple_(*groups[-1]))
+            if last_group is not None:
+                page = page.where(tuple_(*MANIFEST_GROUP) > tuple_(*last_group))
+            last_group = tuple(groups[-1])
+            rows = connection.execute(page).all()
+            if rows:
+                yield [
+                    (train_number, train_name, names.get(source_id, "Unknown"), names.get(destination_id, "Unknown"))
+                    + tuple(rest)
+                    for train_number, train_name, source_id, destination_id, *rest in rows
+                ]
+            if len(groups) < batch_size:
+                break
+
+def write_csv(batches, path):
+    """Write manifest batches to a CSV file with a header row; returns the number of rows."""
+    count = 0
+    with open(path, 'w', newline='', encoding='utf-8') as handle:
+        writer = csv.writer(handle)
+        writer.writerow(MANIFEST_COLUMNS)
+        for batch in batches:
+            writer.writerows(batch)
+            count += len(batch)
+    return count
+
+def _parquet_schema():
+    return pyarrow.schema([
+        ('train_number', pyarrow.string()),
+        ('train_name', pyarrow.string()),
+        ('source', pyarrow.string()),
+        ('destination', pyarrow.string()),
+        ('travel_date', pyarrow.date32()),
+        ('pnr_number', pyarrow.string()),
+        ('booking_date', pyarrow.date32()),
+        ('status', pyarrow.string()),
+        ('ticket_id', pyarrow.int64()),
+        ('passenger_name', pyarrow.string()),
+        ('age', pyarrow.int32()),
+        ('gender', pyarrow.string()),
+    ])
+
+def write_parquet(batches, path):
+    """Write manifest batches to a Parquet file, one row group per batch; returns the number of rows."""
+    if pyarrow is None:
+        raise ImportError("Parquet export requires pyarrow (pip install pyarrow)")
+    schema = _parquet_schema()
+    count = 0
+    with pyarrow.parquet.ParquetWriter(path, schema) as writer:
+        for batch in batches:
+            columns = list(zip(*batch))
+            writer.write_table(pyarrow.Table.from_arrays(
+                [pyarrow.array(column, type=field.type) for column, field in zip(columns, schema)],
+                schema=schema
+            ))
+            count += len(batch)
+    return count
+
+WRITERS = {
+    'csv': write_csv,
+    'parquet': write_parquet,
+}
+
+def export_manifest(path, file_format=None, train_id=None, start_date=None, end_date=None, status=None,
+                    batch_size=EXPORT_BATCH_SIZE):
+    """Export passenger manifests to CSV or Parquet; the format defaults to the file extension.
+
+    Returns the number of ticket rows written.
+    """
+    file_format = (file_format or os.path.splitext(path)[1].lstrip('.') or 'csv').lower()
+    if file_format not in WRITERS:
+        raise ValueError(f"Unsupported export format '{file_format}', use one of: {', '.join(WRITERS)}")
+    if start_date and end_date and start_date > end_date:
+        raise ValueError("Start date must not be after end date")
+    batches = iter_manifest_batches(train_id, start_date, end_date, status, batch_size)
+    return WRITERS[file_format](batches, path)
+
+# ------------------ COMMAND LINE ------------------
+
+def _parse_date(value):
+    return datetime.strptime(value, '%Y-%m-%d').date()
+
+def main(argv=None):
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Export passenger manifests from FastLink")
+    parser.add_argument('path', help="output file (.csv or .parquet)")
+    parser.add_argument('--format', choices=sorted(WRITERS), help="output format (default: from the extension)")
+    parser.add_argument('--train-id', type=int, help="only this train")
+    parser.add_argument('--from', dest='start_date', type=_parse_date, help="first travel date, YYYY-MM-DD")
+    parser.add_argument('--to', dest='end_date', type=_parse_date, help="last travel date, YYYY-MM-DD")
+    parser.add_argument('--status', help="only bookings with this status, e.g. Confirmed")
+    parser.add_argument('--batch-size', type=int, default=EXPORT_BATCH_SIZE)
+    args = parser.parse_args(argv)
+
+    count = export_manifest(args.path, args.format, args.train_id, args.start_date, args.end_date,
+                            args.status, args.batch_size)
+    print(f"Exported {count} tickets to {args.path}")
+
+if __name__ == '__main__':
+    main()
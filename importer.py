@@ -0,0 +1,289 @@
+# importer.py
+import csv
+import json
+import os
+from datetime import date, datetime
+
+from sqlalchemy import bindparam, insert, select, update
+
+from connection import (
+    ALL_DAYS_MASK, DEFAULT_TRAIN_CAPACITY, SeatInventory, Station, Train, WaitlistEntry, _promote_waitlist,
+    after_commit, booking_cache, notify_train_changed, parse_travel_days, session_scope, station_catalog
+)
+
+# Rows validated and written per transaction
+IMPORT_BATCH_SIZE = 5000
+
+TRAIN_FIELDS = ['train_number', 'train_name', 'source', 'destination', 'departure_time', 'arrival_time']
+STATION_FIELDS = ['station_name', 'code']
+
+def read_rows(path, section=None):
+    """Read import rows from a CSV file (with a header) or a JSON file.
+
+    A JSON file holds either a list of objects or an object with "stations"
+    and/or "trains" lists; `section` picks one of those lists. CSV rows are
+    read lazily, so large files are never loaded whole.
+    """
+    if os.path.splitext(path)[1].lower() == '.json':
+        with open(path, encoding='utf-8') as handle:
+            data = json.load(handle)
+        if isinstance(data, dict):
+            data = data.get(section, [])
+        yield from data
+        return
+    with open(path, newline='', encoding='utf-8-sig') as handle:
+        yield from csv.DictReader(handle)
+
+def _batches(rows, size):
+    batch = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) == size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+def _text(row, field):
+    value = row.get(field)
+    return str(value).strip() if value is not None else ''
+
+def _parse_time(value):
+    # The same format add_train accepts
+    try:
+        return datetime.strptime(value, '%H:%M').time()
+    except ValueError:
+        raise ValueError(f"invalid time '{value}', expected HH:MM")
+
+def _check_length(value, column, label):
+    # Rejected per row here rather than by a strict-mode database mid-import
+    if len(value) > column.type.length:
+        raise ValueError(f"{label} '{value}' is longer than {column.type.length} characters")
+
+def _new_result():
+    return {'inserted': 0, 'updated': 0, 'errors': []}
+
+# ------------------ STATIONS ------------------
+
+def _validate_station(row, seen_codes):
+    for field in STATION_FIELDS:
+        if not _text(row, field):
+            raise ValueError(f"missing {field}")
+    station_name = _text(row, 'station_name')
+    code = _text(row, 'code')
+    _check_length(station_name, Station.station_name, "station name")
+    _check_length(code, Station.code, "station code")
+    if code.casefold() in seen_codes:
+        raise ValueError(f"station code {code} appears more than once in the import")
+    seen_codes.add(code.casefold())
+    return {'station_name': station_name, 'code': code}
+
+def import_stations(rows, batch_size=IMPORT_BATCH_SIZE):
+    """Insert new stations and rename existing ones, matched by code.
+
+    rows are dicts with station_name and code. Returns {'inserted', 'updated',
+    'errors'}, where each error is {'row': <1-based row number>, 'error': <message>}.
+    """
+    result = _new_result()
+    seen_codes = set()
+    row_number = 0
+    for batch in _batches(rows, batch_size):
+        new_stations, renamed = [], []
+        for row in batch:
+            row_number += 1
+            try:
+                station = _validate_station(row, seen_codes)
+            except ValueError as e:
+                result['errors'].append({'row': row_number, 'error': str(e)})
+                continue
+            existing = station_catalog.get_by_code(station['code'])
+            if existing is None:
+                new_stations.append(station)
+            elif existing.station_name != station['station_name']:
+                renamed.append({'station_id': existing.station_id, 'station_name': station['station_name']})
+
+        with session_scope() as session:
+            if new_stations:
+                session.execute(insert(Station), new_stations)
+            if renamed:
+                session.execute(update(Station), renamed)
+        result['inserted'] += len(new_stations)
+        result['updated'] += len(renamed)
+        # The next batch must see this one's codes
+        station_catalog.invalidate()
+    return result
+
+# ------------------ TRAINS ------------------
+
+def _validate_train(row, seen_numbers, travel_days_masks):
+    for field in TRAIN_FIELDS:
+        if not _text(row, field):
+            raise ValueError(f"missing {field}")
+    train_number = _text(row, 'train_number')
+    train_name = _text(row, 'train_name')
+    _check_length(train_number, Train.train_number, "train number")
+    _check_length(train_name, Train.train_name, "train name")
+    if train_number in seen_numbers:
+        raise ValueError(f"train number {train_number} appears more than once in the import")
+
+    stations = []
+    for field in ('source', 'destination'):
+        # Codes are the usual form in timetable dumps; full names are accepted too
+        value = _text(row, field)
+        station = station_catalog.get_by_code(value) or station_catalog.get_by_name(value)
+        if station is None:
+            raise ValueError(f"unknown {field} station '{value}'")
+        stations.append(station.station_id)
+
+    # Timetables repeat a handful of patterns, so parse each distinct string once
+    travel_days = _text(row, 'travel_days')
+    _check_length(travel_days, Train.travel_days, "travel days")
+    if travel_days and travel_days not in travel_days_masks:
+        travel_days_masks[travel_days] = parse_travel_days(travel_days)
+
+    capacity = _text(row, 'capacity')
+    if capacity:
+        try:
+            capacity = int(capacity)
+        except ValueError:
+            raise ValueError(f"capacity '{capacity}' is not a whole number")
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+
+    departure_time = _parse_time(_text(row, 'departure_time'))
+    arrival_time = _parse_time(_text(row, 'arrival_time'))
+
+    # Only a valid row claims its number, so a corrected row further down is still accepted
+    seen_numbers.add(train_number)
+    return {
+        'train_number': train_number,
+        'train_name': train_name,
+        'source_id': stations[0],
+        'destination_id': stations[1],
+        'departure_time': departure_time,
+        'arrival_time': arrival_time,
+        # Blank optional fields leave an existing train's value alone
+        'travel_days': travel_days or None,
+        'travel_days_mask': travel_days_masks.get(travel_days),
+        'capacity': capacity or None
+    }
+
+def _write_trains(session, trains):
+    """Insert or update one batch of validated trains; returns (inserted, updated)."""
+    existing = dict(session.execute(
+        select(Train.train_number, Train.train_id).where(Train.train_number.in_([t['train_number'] for t in trains]))
+    ).all())
+
+    new_trains, changed_trains, new_capacities = [], [], []
+    for train in trains:
+        train_id = existing.get(train['train_number'])
+        if train_id is None:
+            train['capacity'] = train['capacity'] or DEFAULT_TRAIN_CAPACITY
+            train['travel_days_mask'] = train['travel_days_mask'] or ALL_DAYS_MASK
+            new_trains.append(train)
+            continue
+        changes = {key: value for key, value in train.items() if value is not None}
+        changes['train_id'] = train_id
+        changed_trains.append(changes)
+        if train['capacity']:
+            new_capacities.append({'id': train_id, 'capacity': train['capacity']})
+
+    if new_trains:
+        session.execute(insert(Train), new_trains)
+    if changed_trains:
+        # Bulk UPDATE by primary key, one executemany per set of columns
+        session.execute(update(Train), changed_trains)
+    if new_capacities:
+        # Like update_train, seat counters for future dates take the new capacity
+        seat_inventory = SeatInventory.__table__
+        session.connection().execute(
+            seat_inventory.update()
+            .where(seat_inventory.c.train_id == bindparam('id'), seat_inventory.c.travel_date >= date.today())
+            .values(capacity=bindparam('capacity')),
+            new_capacities
+        )
+        # Extra seats go to waitlisted bookings, as in update_train
+        waitlisted_dates = session.execute(
+            select(WaitlistEntry.train_id, WaitlistEntry.travel_date)
+            .where(WaitlistEntry.train_id.in_([change['id'] for change in new_capacities]),
+                   WaitlistEntry.travel_date >= date.today())
+            .distinct()
+        ).all()
+        for train_id, travel_date in waitlisted_dates:
+            _promote_waitlist(session, train_id, travel_date)
+    return len(new_trains), len(changed_trains)
+
+def import_trains(rows, batch_size=IMPORT_BATCH_SIZE):
+    """Insert new trains and update existing ones, matched by train number.
+
+    rows are dicts with train_number, train_name, source and destination (station
+    codes or names), departure_time and arrival_time (HH:MM), and optional
+    travel_days and capacity. Each batch is validated first and written in one
+    transaction; rows that fail validation are skipped and reported as
+    {'row': <1-based row number>, 'error': <message>}. Returns {'inserted',
+    'updated', 'errors'}.
+    """
+    result = _new_result()
+    seen_numbers = set()
+    travel_days_masks = {}
+    row_number = 0
+    for batch in _batches(rows, batch_size):
+        trains = []
+        for row in batch:
+            row_number += 1
+            try:
+                trains.append(_validate_train(row, seen_numbers, travel_days_masks))
+            except ValueError as e:
+                result['errors'].append({'row': row_number, 'error': str(e)})
+        if not trains:
+            continue
+
+        with session_scope() as session:
+            inserted, updated = _write_trains(session, trains)
+        result['inserted'] += inserted
+        result['updated'] += updated
+
+    if result['updated']:
+        # Cached booking details embed train names
+        after_commit(booking_cache.clear)
+    if result['inserted'] or result['updated']:
+        after_commit(notify_train_changed, None)
+    return result
+
+def import_timetable(path, batch_size=IMPORT_BATCH_SIZE):
+    """Import a JSON dump with "stations" and "trains" lists; stations go first so trains can use them."""
+    return {
+        'stations': import_stations(read_rows(path, 'stations'), batch_size),
+        'trains': import_trains(read_rows(path, 'trains'), batch_size)
+    }
+
+# ------------------ COMMAND LINE ------------------
+
+def _print_result(label, result, max_errors=20):
+    print(f"{label}: {result['inserted']} inserted, {result['updated']} updated, {len(result['errors'])} rejected")
+    for error in result['errors'][:max_errors]:
+        print(f"  row {error['row']}: {error['error']}")
+    if len(result['errors']) > max_errors:
+        print(f"  ... and {len(result['errors']) - max_errors} more")
+
+def main(argv=None):
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Bulk import stations and trains into FastLink")
+    parser.add_argument('kind', choices=['stations', 'trains', 'timetable'],
+                        help="what the file holds; a timetable is a JSON file with both")
+    parser.add_argument('path', help="CSV or JSON file")
+    parser.add_argument('--batch-size', type=int, default=IMPORT_BATCH_SIZE)
+    args = parser.parse_args(argv)
+
+    if args.kind == 'timetable':
+        results = import_timetable(args.path, args.batch_size)
+        _print_result("Stations", results['stations'])
+        _print_result("Trains", results['trains'])
+    elif args.kind == 'stations':
+        _print_result("Stations", import_stations(read_rows(args.path, 'stations'), args.batch_size))
+    else:
+        _print_result("Trains", import_trains(read_rows(args.path, 'trains'), args.batch_size))
+
+if __name__ == '__main__':
+    main()
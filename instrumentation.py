@@ -0,0 +1,384 @@
+# instrumentation.py
+import bisect
+import contextvars
+import inspect
+import json
+import logging
+import os
+import threading
+import time
+import weakref
+from collections import deque
+from functools import wraps
+
+from sqlalchemy import event
+
+# Opt in with FASTLINK_INSTRUMENT=1; FASTLINK_METRICS_PORT also serves the results
+# on 127.0.0.1, and FASTLINK_SLOW_QUERY_MS sets the slow query threshold.
+SLOW_QUERY_MS = float(os.environ.get('FASTLINK_SLOW_QUERY_MS', '100'))
+
+# Upper bounds, in seconds, of the helper latency histogram buckets
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+# Recent call durations kept per helper for percentiles
+LATENCY_SAMPLES = 2048
+# Recent slow statements kept for the JSON report
+SLOW_QUERY_HISTORY = 50
+
+# Statements run outside any instrumented helper are counted under this name
+UNATTRIBUTED = '(other)'
+
+slow_query_log = logging.getLogger('fastlink.slow_query')
+
+_enabled = False
+_lock = threading.Lock()
+_engines = weakref.WeakSet()
+# Helper calls in progress in this thread or task, outermost first
+_active_calls = contextvars.ContextVar('fastlink_active_calls', default=())
+# Their helper names, for slow query reports
+_helper_names = contextvars.ContextVar('fastlink_helper_names', default=())
+
+class HelperStats:
+    """Call, statement and latency totals for one helper."""
+
+    def __init__(self):
+        self.calls = 0
+        self.errors = 0
+        self.statements = 0
+        self.db_time = 0.0
+        self.total_time = 0.0
+        self.max_time = 0.0
+        self.buckets = [0] * (len(LATENCY_BUCKETS) + 1)
+        self.samples = deque(maxlen=LATENCY_SAMPLES)
+
+    def record_call(self, elapsed, statements, db_time, failed):
+        self.calls += 1
+        self.errors += failed
+        self.statements += statements
+        self.db_time += db_time
+        self.total_time += elapsed
+        self.max_time = max(self.max_time, elapsed)
+        self.buckets[bisect.bisect_left(LATENCY_BUCKETS, elapsed)] += 1
+        self.samples.append(elapsed)
+
+    def percentile(self, fraction):
+        if not self.samples:
+            return 0.0
+        ordered = sorted(self.samples)
+        return ordered[min(int(fraction * len(ordered)), len(ordered) - 1)]
+
+    def as_dict(self):
+        return {
+            'calls': self.calls,
+            'errors': self.errors,
+            'statements': self.statements,
+            'db_ms': round(self.db_time * 1000, 3),
+            'avg_ms': round(self.total_time * 1000 / self.calls, 3) if self.calls else 0.0,
+            'p50_ms': round(self.percentile(0.50) * 1000, 3),
+            'p95_ms': round(self.percentile(0.95) * 1000, 3),
+            'p99_ms': round(self.percentile(0.99) * 1000, 3),
+            'max_ms': round(self.max_time * 1000, 3),
+        }
+
+class _Call:
+    __slots__ = ('statements', 'db_time')
+
+    def __init__(self):
+        self.statements = 0
+        self.db_time = 0.0
+
+_helpers = {}
+_slow_queries = deque(maxlen=SLOW_QUERY_HISTORY)
+_slow_query_count = 0
+
+def _stats_for(name):
+    stats = _helpers.get(name)
+    if stats is None:
+        stats = _helpers[name] = HelperStats()
+    return stats
+
+# ------------------ ENGINE EVENTS ------------------
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault('fastlink_query_start', []).append(time.perf_counter())
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    starts = conn.info.get('fastlink_query_start')
+    if not starts:
+        return
+    elapsed = time.perf_counter() - starts.pop()
+    _record_statement(statement, elapsed)
+
+def _handle_error(exception_context):
+    conn = exception_context.connection
+    if conn is not None and conn.info.get('fastlink_query_start'):
+        elapsed = time.perf_counter() - conn.info['fastlink_query_start'].pop()
+        _record_statement(exception_context.statement or '', elapsed)
+
+def _record_statement(statement, elapsed):
+    global _slow_query_count
+    calls = _active_calls.get()
+    for call in calls:
+        call.statements += 1
+        call.db_time += elapsed
+    names = _helper_names.get()
+    helper = names[-1] if names else UNATTRIBUTED
+    if not calls:
+        with _lock:
+            stats = _stats_for(UNATTRIBUTED)
+            stats.statements += 1
+            stats.db_time += elapsed
+
+    if elapsed * 1000 >= SLOW_QUERY_MS:
+        text_value = ' '.join(statement.split())
+        with _lock:
+            _slow_query_count += 1
+            _slow_queries.append({
+                'helper': helper,
+                'ms': round(elapsed * 1000, 3),
+                'statement': text_value[:500],
+                'at': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            })
+        slow_query_log.warning("slow query (%.1f ms) in %s: %s", elapsed * 1000, helper, text_value[:500])
+
+_LISTENERS = (
+    ('before_cursor_execute', _before_cursor_execute),
+    ('after_cursor_execute', _after_cursor_execute),
+    ('handle_error', _handle_error),
+)
+
+def _listen(engine):
+    for name, listener in _LISTENERS:
+        if not event.contains(engine, name, listener):
+            event.listen(engine, name, listener)
+
+def attach(engine):
+    """Register an engine; its statements are timed whenever instrumentation is enabled."""
+    # Events on an AsyncEngine are registered on the sync engine it wraps
+    engine = getattr(engine, 'sync_engine', engine)
+    _engines.add(engine)
+    if _enabled:
+        _listen(engine)
+
+# ------------------ HELPERS ------------------
+
+def instrumented(func):
+    """Decorator that records calls, statements and latency for a helper while enabled.
+
+    A helper called from another instrumented helper is recorded under its own
+    name as well, so the outer helper's figures include it. Coroutine functions
+    are recorded under "async." plus their name.
+    """
+    if inspect.iscoroutinefunction(func):
+        return _instrumented_async(func)
+    name = func.__name__
+
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        if not _enabled:
+            return func(*args, **kwargs)
+        call, tokens, start = _begin_call(name)
+        failed = True
+        try:
+            result = func(*args, **kwargs)
+            failed = False
+            return result
+        finally:
+            _end_call(name, call, tokens, start, failed)
+    return wrapper
+
+def _instrumented_async(func):
+    name = f"async.{func.__name__}"
+
+    @wraps(func)
+    async def wrapper(*args, **kwargs):
+        if not _enabled:
+            return await func(*args, **kwargs)
+        # Each task runs in its own context, so concurrent calls do not mix
+        call, tokens, start = _begin_call(name)
+        failed = True
+        try:
+            result = await func(*args, **kwargs)
+            failed = False
+            return result
+        finally:
+            _end_call(name, call, tokens, start, failed)
+    return wrapper
+
+def _begin_call(name):
+    call = _Call()
+    tokens = (_active_calls.set(_active_calls.get() + (call,)), _helper_names.set(_helper_names.get() + (name,)))
+    return call, tokens, time.perf_counter()
+
+def _end_call(name, call, tokens, start, failed):
+    elapsed = time.perf_counter() - start
+    _active_calls.reset(tokens[0])
+    _helper_names.reset(tokens[1])
+    with _lock:
+        _stats_for(name).record_call(elapsed, call.statements, call.db_time, failed)
+
+# ------------------ CONTROL ------------------
+
+def enable(slow_query_ms=None):
+    """Start recording; slow_query_ms overrides FASTLINK_SLOW_QUERY_MS."""
+    global _enabled, SLOW_QUERY_MS
+    if slow_query_ms is not None:
+        SLOW_QUERY_MS = float(slow_query_ms)
+    _enabled = True
+    for engine in list(_engines):
+        _listen(engine)
+
+def disable():
+    """Stop recording and remove the engine listeners; totals so far are kept."""
+    global _enabled
+    _enabled = False
+    for engine in list(_engines):
+        for name, listener in _LISTENERS:
+            if event.contains(engine, name, listener):
+                event.remove(engine, name, listener)
+
+def is_enabled():
+    return _enabled
+
+def reset():
+    """Clear all recorded totals."""
+    global _slow_query_count
+    with _lock:
+        _helpers.clear()
+        _slow_queries.clear()
+        _slow_query_count = 0
+
+# ------------------ EXPORT ------------------
+
+def snapshot():
+    """All totals as a JSON-ready dict, helpers sorted by database time."""
+    with _lock:
+        helpers = sorted(_helpers.items(), key=lambda item: item[1].db_time, reverse=True)
+        return {
+            'enabled': _enabled,
+            'slow_query_ms': SLOW_QUERY_MS,
+            'slow_queries_total': _slow_query_count,
+            'helpers': {name: stats.as_dict() for name, stats in helpers},
+            'recent_slow_queries': list(_slow_queries),
+        }
+
+def to_json():
+    return json.dumps(snapshot(), indent=2)
+
+def _label(value):
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+def to_prometheus():
+    """All totals in the Prometheus text exposition format."""
+    lines = []
+
+    def metric(name, kind, help_text, samples):
+        lines.append(f"# HELP {name} {help_text}")
+        lines.append(f"# TYPE {name} {kind}")
+        lines.extend(samples)
+
+    with _lock:
+        helpers = sorted(_helpers.items())
+        metric('fastlink_helper_calls_total', 'counter', 'Calls per connection helper.',
+               [f'fastlink_helper_calls_total{{helper="{_label(name)}"}} {stats.calls}' for name, stats in helpers])
+        metric('fastlink_helper_errors_total', 'counter', 'Calls that raised, per connection helper.',
+               [f'fastlink_helper_errors_total{{helper="{_label(name)}"}} {stats.errors}' for name, stats in helpers])
+        metric('fastlink_helper_statements_total', 'counter', 'SQL statements run per connection helper.',
+               [f'fastlink_helper_statements_total{{helper="{_label(name)}"}} {stats.statements}'
+                for name, stats in helpers])
+        metric('fastlink_helper_db_seconds_total', 'counter', 'Time spent executing SQL per connection helper.',
+               [f'fastlink_helper_db_seconds_total{{helper="{_label(name)}"}} {stats.db_time:.6f}'
+                for name, stats in helpers])
+
+        samples = []
+        for name, stats in helpers:
+            if not stats.calls:
+                continue
+            label = _label(name)
+            cumulative = 0
+            for bound, count in zip(LATENCY_BUCKETS + (float('inf'),), stats.buckets):
+                cumulative += count
+                le = '+Inf' if bound == float('inf') else repr(bound)
+                samples.append(f'fastlink_helper_duration_seconds_bucket{{helper="{label}",le="{le}"}} {cumulative}')
+            samples.append(f'fastlink_helper_duration_seconds_sum{{helper="{label}"}} {stats.total_time:.6f}')
+            samples.append(f'fastlink_helper_duration_seconds_count{{helper="{label}"}} {stats.calls}')
+        metric('fastlink_helper_duration_seconds', 'histogram', 'Wall-clock duration of connection helper calls.',
+               samples)
+        metric('fastlink_slow_queries_total', 'counter', 'Statements slower than the slow query threshold.',
+               [f'fastlink_slow_queries_total {_slow_query_count}'])
+    return '\n'.join(lines) + '\n'
+
+def dump(path):
+    """Write the totals to path: Prometheus text for .prom or .txt, JSON otherwise."""
+    output = to_prometheus() if os.path.splitext(path)[1].lower() in ('.prom', '.txt') else to_json()
+    with open(path, 'w', encoding='utf-8') as handle:
+        handle.write(output)
+
+def serve(port, host='127.0.0.1'):
+    """Serve /metrics (Prometheus) and /metrics.json from a daemon thread; returns the server."""
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    class MetricsHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path.split('?')[0] == '/metrics':
+                body, content_type = to_prometheus(), 'text/plain; version=0.0.4'
+            elif self.path.split('?')[0] == '/metrics.json':
+                body, content_type = to_json(), 'application/json'
+            else:
+                self.send_error(404)
+                return
+            data = body.encode('utf-8')
+            self.send_response(200)
+            self.send_header('Content-Type', content_type)
+            self.send_header('Content-Length', str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def log_message(self, format, *args):
+            pass  # Scrapes would otherwise log every request to stderr
+
+    server = ThreadingHTTPServer((host, port), MetricsHandler)
+    threading.Thread(target=server.serve_forever, name='fastlink-metrics', daemon=True).start()
+    return server
+
+if os.environ.get('FASTLINK_INSTRUMENT', '').strip().lower() in ('1', 'true', 'yes', 'on'):
+    enable()
+    if os.environ.get('FASTLINK_METRICS_PORT'):
+        serve(int(os.environ['FASTLINK_METRICS_PORT']))
+
+# ------------------ COMMAND LINE ------------------
+
+def main(argv=None):
+    import argparse
+    import runpy
+    import sys
+
+    parser = argparse.ArgumentParser(
+        description="Run a FastLink script (e.g. gui.py) with instrumentation and dump the totals at exit"
+    )
+    parser.add_argument('-o', '--output', help="write totals here (.json, or .prom for Prometheus text); "
+                                               "default: print JSON")
+    parser.add_argument('--port', type=int, help="also serve /metrics and /metrics.json on 127.0.0.1:PORT")
+    parser.add_argument('--slow-query-ms', type=float, help=f"slow query threshold (default {SLOW_QUERY_MS:g})")
+    parser.add_argument('script', help="Python file to run")
+    parser.add_argument('args', nargs=argparse.REMAINDER, help="arguments for the script")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(format='%(asctime)s %(name)s %(message)s')
+    enable(args.slow_query_ms)
+    if args.port:
+        serve(args.port)
+
+    sys.argv = [args.script] + args.args
+    sys.path.insert(0, os.path.dirname(os.path.abspath(args.script)))
+    try:
+        runpy.run_path(args.script, run_name='__main__')
+    finally:
+        if args.output:
+            dump(args.output)
+        else:
+            print(to_json())
+
+if __name__ == '__main__':
+    # Run main() in the importable module so connection.py sees the enabled state
+    import instrumentation
+    instrumentation.main()
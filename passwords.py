@@ -0,0 +1,80 @@
+# passwords.py
+import base64
+import hashlib
+import hmac
+import os
+import re
+
+# Work factors; raise them as hardware gets faster. Stored hashes record their
+# own parameters, so older hashes keep verifying and are upgraded on login.
+PASSWORD_SCHEME = os.environ.get('FASTLINK_PASSWORD_SCHEME', 'scrypt')
+SCRYPT_LOG2_N = int(os.environ.get('FASTLINK_SCRYPT_LOG2_N', '14'))
+SCRYPT_R = int(os.environ.get('FASTLINK_SCRYPT_R', '8'))
+SCRYPT_P = int(os.environ.get('FASTLINK_SCRYPT_P', '1'))
+PBKDF2_ITERATIONS = int(os.environ.get('FASTLINK_PBKDF2_ITERATIONS', '600000'))
+
+SALT_BYTES = 16
+HASH_BYTES = 32
+
+_SHA256_HEX = re.compile(r'[0-9a-fA-F]{64}')
+
+def _encode(raw):
+    return base64.b64encode(raw).decode('ascii').rstrip('=')
+
+def _decode(text_value):
+    return base64.b64decode(text_value + '=' * (-len(text_value) % 4))
+
+def _scrypt(password, salt, log2_n, r, p):
+    n = 1 << log2_n
+    # hashlib's default 32 MiB cap is too small for n above 2**14
+    return hashlib.scrypt(password.encode('utf-8'), salt=salt, n=n, r=r, p=p,
+                          maxmem=256 * n * r * p + (1 << 20), dklen=HASH_BYTES)
+
+def _pbkdf2(password, salt, iterations):
+    return hashlib.pbkdf2_hmac('sha256', password.encode('utf-8'), salt, iterations, dklen=HASH_BYTES)
+
+def hash_password(password, scheme=None):
+    """Return a salted hash such as "scrypt$14$8$1$<salt>$<hash>" for storing in users.password."""
+    scheme = scheme or PASSWORD_SCHEME
+    salt = os.urandom(SALT_BYTES)
+    if scheme == 'scrypt':
+        derived = _scrypt(password, salt, SCRYPT_LOG2_N, SCRYPT_R, SCRYPT_P)
+        return f"scrypt${SCRYPT_LOG2_N}${SCRYPT_R}${SCRYPT_P}${_encode(salt)}${_encode(derived)}"
+    if scheme == 'pbkdf2_sha256':
+        derived = _pbkdf2(password, salt, PBKDF2_ITERATIONS)
+        return f"pbkdf2_sha256${PBKDF2_ITERATIONS}${_encode(salt)}${_encode(derived)}"
+    raise ValueError(f"Unknown password scheme '{scheme}'")
+
+def needs_rehash(stored):
+    """True for legacy rows and for hashes made with a different scheme or work factor."""
+    if PASSWORD_SCHEME == 'scrypt':
+        return not stored.startswith(f"scrypt${SCRYPT_LOG2_N}${SCRYPT_R}${SCRYPT_P}$")
+    return not stored.startswith(f"pbkdf2_sha256${PBKDF2_ITERATIONS}$")
+
+def verify_password(password, stored):
+    """Check a password against a stored value; returns (matches, needs_rehash).
+
+    Besides the KDF formats, this accepts the legacy rows still in the users
+    table: unsalted SHA-256 hex digests and plain text. Those always need a
+    rehash. This is deliberately slow, so call it outside any database session
+    and off the GUI thread; hashlib releases the GIL while deriving.
+    """
+    if stored is None:
+        return False, False
+    fields = stored.split('$')
+    try:
+        if fields[0] == 'scrypt' and len(fields) == 6:
+            log2_n, r, p = (int(value) for value in fields[1:4])
+            derived = _scrypt(password, _decode(fields[4]), log2_n, r, p)
+            return hmac.compare_digest(derived, _decode(fields[5])), needs_rehash(stored)
+        if fields[0] == 'pbkdf2_sha256' and len(fields) == 4:
+            derived = _pbkdf2(password, _decode(fields[2]), int(fields[1]))
+            return hmac.compare_digest(derived, _decode(fields[3])), needs_rehash(stored)
+    except ValueError:
+        return False, False
+
+    if _SHA256_HEX.fullmatch(stored):
+        # Never fall through to the plain-text check: typing the digest itself must not log in
+        digest = hashlib.sha256(password.encode('utf-8')).hexdigest()
+        return hmac.compare_digest(digest, stored.lower()), True
+    return hmac.compare_digest(password.encode('utf-8'), stored.encode('utf-8')), True
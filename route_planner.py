@@ -0,0 +1,262 @@
+# route_planner.py
+from bisect import bisect_left, insort
+from collections import namedtuple
+import threading
+
+import connection
+from connection import ALL_DAYS_MASK, Session, Train, read_only
+from instrumentation import instrumented
+
+MINUTES_PER_DAY = 24 * 60
+
+# Minimum time between arriving on one train and boarding the next
+DEFAULT_MIN_CONNECTION = 15
+
+Leg = namedtuple('Leg', ['train_id', 'train_number', 'train_name', 'source_id', 'destination_id',
+                         'departure', 'duration', 'travel_days_mask'], defaults=(ALL_DAYS_MASK,))
+
+def _minutes(value):
+    return value.hour * 60 + value.minute
+
+def leg_from_train(train):
+    """Build a Leg from a Train row; trains without both stations are not routable."""
+    if train.source_id is None or train.destination_id is None:
+        return None
+    departure = _minutes(train.departure_time)
+    duration = (_minutes(train.arrival_time) - departure) % MINUTES_PER_DAY
+    return Leg(train.train_id, train.train_number, train.train_name, train.source_id, train.destination_id,
+               departure, duration, train.travel_days_mask)
+
+def _format_time(absolute_minutes):
+    day, minutes = divmod(absolute_minutes, MINUTES_PER_DAY)
+    text = f"{minutes // 60:02d}:{minutes % 60:02d}"
+    return f"{text} (+{day}d)" if day else text
+
+class RouteGraph:
+    """Daily timetable as adjacency lists of departures, keyed by station.
+
+    Each station maps to its departures sorted by time of day, so a search can
+    bisect to the first train leaving after it arrives and stop scanning once no
+    later departure can beat the best arrival found so far. Times past midnight
+    roll over to the next day; when the weekday of the first day is known,
+    departures on days a train does not run are skipped.
+    """
+
+    def __init__(self, legs=()):
+        self._lock = threading.RLock()
+        self._legs = {}
+        self._departures = {}
+        for leg in legs:
+            self.add_leg(leg)
+
+    def __len__(self):
+        return len(self._legs)
+
+    def add_leg(self, leg):
+        with self._lock:
+            self.remove_train(leg.train_id)
+            self._legs[leg.train_id] = leg
+            insort(self._departures.setdefault(leg.source_id, []), (leg.departure, leg.train_id))
+
+    def remove_train(self, train_id):
+        with self._lock:
+            leg = self._legs.pop(train_id, None)
+            if leg is None:
+                return
+            departures = self._departures[leg.source_id]
+            del departures[bisect_left(departures, (leg.departure, leg.train_id))]
+            if not departures:
+                del self._departures[leg.source_id]
+
+    def _earliest_arrivals(self, source_id, destination_id, start, max_legs, min_connection, first_weekday=None):
+        """Round-based earliest-arrival search; round k allows k legs.
+
+        Returns one label table per round: {station_id: (arrival, leg, departure, previous_station)}.
+        """
+        rounds = [{source_id: (start, None, None, None)}]
+        best = {source_id: start}
+        marked = {source_id}
+
+        for round_number in range(1, max_legs + 1):
+            previous = rounds[-1]
+            labels = {}
+            for station_id in marked:
+                arrival = previous[station_id][0]
+                # No connection time is needed before the first leg
+                ready = arrival + (min_connection if round_number > 1 else 0)
+                departures = self._departures.get(station_id)
+                if not departures:
+                    continue
+
+                day, time_of_day = divmod(ready, MINUTES_PER_DAY)
+                first = bisect_left(departures, (time_of_day, -1))
+                # Look at most one day ahead; a longer wait is not a useful connection
+                for offset in range(len(departures)):
+                    position = first + offset
+                    wrapped, position = divmod(position, len(departures))
+                    departure_time, train_id = departures[position]
+                    departure = (day + wrapped) * MINUTES_PER_DAY + departure_time
+                    # Departures are visited in time order, so nothing later can arrive sooner
+                    if departure >= best.get(destination_id, float('inf')):
+                        break
+                    leg = self._legs[train_id]
+                    if first_weekday is not None and not leg.travel_days_mask & (1 << ((first_weekday + day + wrapped) % 7)):
+                        continue
+                    leg_arrival = departure + leg.duration
+                    target = leg.destination_id
+                    if leg_arrival < best.get(target, float('inf')):
+                        best[target] = leg_arrival
+                        labels[target] = (leg_arrival, leg, departure, station_id)
+
+            if not labels:
+                break
+            rounds.append(labels)
+            marked = set(labels)
+        return rounds
+
+    def search(self, source_id, destination_id, depart_after=0, max_changes=2,
+               min_connection=DEFAULT_MIN_CONNECTION, first_weekday=None):
+        """Return the fastest journey for each number of legs, fewest legs first.
+
+        Each journey is a list of (leg, departure, arrival) with times in minutes
+        from midnight of the travel day. first_weekday is that day's weekday()
+        and enables the running-day check.
+        """
+        if source_id == destination_id:
+            return []
+        with self._lock:
+            rounds = self._earliest_arrivals(source_id, destination_id, depart_after,
+                                             max_changes + 1, min_connection, first_weekday)
+            journeys = []
+            best_arrival = float('inf')
+            for legs_used in range(1, len(rounds)):
+                label = rounds[legs_used].get(destination_id)
+                # Keep only journeys that arrive earlier than ones with fewer changes
+                if label and label[0] < best_arrival:
+                    best_arrival = label[0]
+                    journeys.append(self._reconstruct(rounds, destination_id, legs_used))
+            return journeys
+
+    def _reconstruct(self, rounds, destination_id, legs_used):
+        # A label in round k always points at a station labelled in round k - 1
+        legs = []
+        station_id = destination_id
+        for round_number in range(legs_used, 0, -1):
+            arrival, leg, departure, previous_station = rounds[round_number][station_id]
+            legs.append((leg, departure, arrival))
+            station_id = previous_station
+        legs.reverse()
+        return legs
+
+class RouteIndex:
+    """Process-wide RouteGraph built from the trains table on first use.
+
+    connection.py reports every add/update/delete of a train, and only that
+    train's leg is reloaded; only bulk changes such as imports rebuild it.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._graph = None
+
+    def graph(self):
+        if self._graph is None:
+            with self._lock:
+                if self._graph is None:
+                    session = Session()
+                    try:
+                        legs = [leg_from_train(train) for train in session.query(Train).yield_per(1000)]
+                    finally:
+                        session.close()
+                    self._graph = RouteGraph(leg for leg in legs if leg)
+        return self._graph
+
+    def on_train_changed(self, train_id):
+        graph = self._graph
+        if graph is None:
+            return
+        if train_id is None:
+            # Bulk change; rebuild on next use
+            self.invalidate()
+            return
+        session = Session()
+        try:
+            train = session.query(Train).filter_by(train_id=train_id).first()
+        finally:
+            session.close()
+        leg = leg_from_train(train) if train else None
+        if leg:
+            graph.add_leg(leg)
+        else:
+            graph.remove_train(train_id)
+
+    def invalidate(self):
+        with self._lock:
+            self._graph = None
+
+route_index = RouteIndex()
+connection.add_train_change_listener(route_index.on_train_changed)
+
+@instrumented
+@read_only
+def search_connecting_trains(source, destination, depart_after="00:00", max_changes=2,
+                             min_connection=DEFAULT_MIN_CONNECTION, limit=5, travel_date=None):
+    """Search direct and connecting journeys between two station names.
+
+    Returns up to `limit` itineraries ordered by departure, each with its legs,
+    number of changes, departure/arrival times and total duration in minutes.
+    With a travel_date, every leg must run on the day it is taken.
+    """
+    source_station = connection.station_catalog.resolve(source)
+    destination_station = connection.station_catalog.resolve(destination)
+    if not source_station or not destination_station:
+        return []
+
+    hours, minutes = map(int, depart_after.split(':'))
+    start = hours * 60 + minutes
+    graph = route_index.graph()
+
+    itineraries = []
+    seen = set()
+    ready = start
+    # Step through the day: each pass finds the next departures at or after `ready`
+    while len(itineraries) < limit and ready < start + MINUTES_PER_DAY:
+        journeys = graph.search(source_station.station_id, destination_station.station_id,
+                                depart_after=ready, max_changes=max_changes, min_connection=min_connection,
+                                first_weekday=travel_date.weekday() if travel_date else None)
+        # Anything leaving a full day later just repeats an itinerary already found
+        journeys = [journey for journey in journeys if journey[0][1] < start + MINUTES_PER_DAY]
+        if not journeys:
+            break
+        for journey in journeys:
+            key = tuple((leg.train_id, departure) for leg, departure, _ in journey)
+            if key not in seen:
+                seen.add(key)
+                itineraries.append(journey)
+        ready = min(journey[0][1] for journey in journeys) + 1
+
+    itineraries.sort(key=lambda journey: (journey[0][1], journey[-1][2]))
+    return [_itinerary_to_dict(journey) for journey in itineraries[:limit]]
+
+def _itinerary_to_dict(journey):
+    catalog = connection.station_catalog
+    departure = journey[0][1]
+    arrival = journey[-1][2]
+    return {
+        'legs': [
+            {
+                'train_id': leg.train_id,
+                'train_number': leg.train_number,
+                'train_name': leg.train_name,
+                'source': catalog.name_for(leg.source_id),
+                'destination': catalog.name_for(leg.destination_id),
+                'departure_time': _format_time(leg_departure),
+                'arrival_time': _format_time(leg_arrival)
+            }
+            for leg, leg_departure, leg_arrival in journey
+        ],
+        'changes': len(journey) - 1,
+        'departure_time': _format_time(departure),
+        'arrival_time': _format_time(arrival),
+        'duration_minutes': arrival - departure
+    }
@@ -0,0 +1,184 @@
+# station_index.py
+from bisect import bisect_left, insort
+import heapq
+import math
+import re
+
+# Fuzzy matches scoring below this are not suggested
+MIN_SIMILARITY = 0.3
+
+# Trigrams in more than this share of stations (e.g. " cit" from every "City")
+# never nominate fuzzy candidates on their own
+COMMON_TRIGRAM_SHARE = 0.05
+
+_NON_ALNUM = re.compile(r'[^0-9a-z]+')
+
+def normalize(value):
+    """Casefold and reduce punctuation and runs of spaces to single spaces."""
+    return _NON_ALNUM.sub(' ', value.casefold()).strip()
+
+def trigrams(value):
+    """Character trigrams of a normalized string, padded so word starts weigh more."""
+    padded = f"  {value} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+class StationIndex:
+    """Prefix and trigram lookups over station names and codes.
+
+    Prefix matching works like a trie flattened into sorted key lists: all keys
+    starting with a prefix sit in one contiguous run, found with a bisect, so a
+    lookup costs O(log n + limit) however many stations share the prefix. Names
+    are also indexed from each word, so "city" finds "Bengaluru City". The
+    trigram postings back similarity search for misspellings such as
+    "Bengaluru Cy".
+    """
+
+    def __init__(self, entries=()):
+        self._entries = {}
+        # (key, station_id) pairs, sorted; codes rank above names, names above later words
+        self._codes = []
+        self._names = []
+        self._words = []
+        self._trigrams = {}
+        self._station_grams = {}
+        # Bulk load: append everything, then sort each key list once
+        for entry in entries:
+            if entry.station_id in self._entries:
+                self.remove(entry.station_id)
+            self._store(entry, list.append)
+        for keys in (self._codes, self._names, self._words):
+            keys.sort()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def add(self, entry):
+        """Index a station entry (anything with station_id, station_name and code)."""
+        if entry.station_id in self._entries:
+            self.remove(entry.station_id)
+        self._store(entry, insort)
+
+    def _store(self, entry, place):
+        self._entries[entry.station_id] = entry
+        for keys, key in self._keys(entry):
+            place(keys, (key, entry.station_id))
+        grams = self._grams(entry)
+        for gram in grams:
+            self._trigrams.setdefault(gram, set()).add(entry.station_id)
+        self._station_grams[entry.station_id] = grams
+
+    def remove(self, station_id):
+        entry = self._entries.pop(station_id, None)
+        if entry is None:
+            return
+        for keys, key in self._keys(entry):
+            position = bisect_left(keys, (key, station_id))
+            if position < len(keys) and keys[position] == (key, station_id):
+                del keys[position]
+        for gram in self._station_grams.pop(station_id):
+            postings = self._trigrams.get(gram)
+            if postings:
+                postings.discard(station_id)
+                if not postings:
+                    del self._trigrams[gram]
+
+    def _keys(self, entry):
+        name = normalize(entry.station_name)
+        yield self._names, name
+        yield self._codes, normalize(entry.code)
+        words = name.split(' ')
+        for position in range(1, len(words)):
+            yield self._words, ' '.join(words[position:])
+
+    def _grams(self, entry):
+        # Codes are too short for trigrams to say much; they are matched exactly or by prefix
+        return trigrams(normalize(entry.station_name))
+
+    def prefix(self, text_value, limit=10):
+        """Stations whose code, name or any later word of the name starts with text_value."""
+        query = normalize(text_value)
+        if not query:
+            return []
+        found = []
+        seen = set()
+        for keys in (self._codes, self._names, self._words):
+            position = bisect_left(keys, (query,))
+            while position < len(keys) and len(found) < limit:
+                key, station_id = keys[position]
+                if not key.startswith(query):
+                    break
+                if station_id not in seen:
+                    seen.add(station_id)
+                    found.append(self._entries[station_id])
+                position += 1
+        return found
+
+    def similar(self, text_value, limit=10, min_similarity=MIN_SIMILARITY):
+        """The top `limit` stations by trigram (Jaccard) similarity, as (entry, score) pairs.
+
+        A station scoring at least t must share one of the query's
+        len(query) - ceil(t * len(query)) + 1 rarest trigrams. Postings are read
+        rarest first, and t rises to the current limit-th best score as matches
+        are found. Postings of common trigrams are skipped altogether: a station
+        sharing only words like "City" with the query is not a useful match.
+        """
+        query_grams = trigrams(normalize(text_value))
+        if not query_grams:
+            return []
+        size = len(query_grams)
+        rarest = sorted(query_grams, key=lambda gram: len(self._trigrams.get(gram, ())))
+
+        common = max(50, len(self._entries) * COMMON_TRIGRAM_SHARE)
+        threshold = min_similarity
+        best = []  # min-heap of (score, -station_id), at most `limit` long
+        seen = set()
+        position = 0
+        while position < size - math.ceil(threshold * size) + 1:
+            postings = self._trigrams.get(rarest[position], ())
+            if len(postings) > common:
+                break  # The rest are at least as common
+            for station_id in postings:
+                if station_id in seen:
+                    continue
+                seen.add(station_id)
+                grams = self._station_grams[station_id]
+                # Jaccard can only reach the threshold if the sizes are close enough
+                if len(grams) < threshold * size or threshold * len(grams) > size:
+                    continue
+                hits = len(query_grams & grams)
+                score = hits / (size + len(grams) - hits)
+                if score < threshold:
+                    continue
+                heapq.heappush(best, (score, -station_id))
+                if len(best) > limit:
+                    heapq.heappop(best)
+                if len(best) == limit and best[0][0] > threshold:
+                    threshold = best[0][0]
+                    window = size - math.ceil(threshold * size) + 1
+                    if window <= position:
+                        break  # Everything that could still rank shares an earlier trigram
+            position += 1
+
+        ranked = sorted(best, reverse=True)
+        return [(self._entries[-negative_id], score) for score, negative_id in ranked]
+
+    def suggest(self, text_value, limit=10):
+        """Prefix matches first, then the closest fuzzy matches to fill up to limit."""
+        found = self.prefix(text_value, limit)
+        # Fuzzy matches on one or two letters are noise
+        if len(found) < limit and len(normalize(text_value)) >= 3:
+            seen = {entry.station_id for entry in found}
+            for entry, _ in self.similar(text_value, limit):
+                if entry.station_id not in seen and len(found) < limit:
+                    found.append(entry)
+        return found
+
+    def unique_prefix(self, text_value):
+        """The one station whose code, name or a later word starts with text_value, or None.
+
+        Fuzzy matches are deliberately not used: names sharing a word such as
+        "Junction" score well against each other, so a typo could silently
+        resolve to a different station. They are offered through suggest().
+        """
+        matches = self.prefix(text_value, 2)
+        return matches[0] if len(matches) == 1 else None